@@ -4,10 +4,20 @@ This module parses the ORGA Excel file and extracts all service information
 (hotels, transfers, activities, restaurants, car rentals, golf) into structured data.
 """
 import logging
+import re
+import sys
 from datetime import datetime, date
-from typing import Optional, List, Dict, Any, Tuple
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Optional, List, Dict, Any, Mapping, NamedTuple, Tuple, Callable, Iterator
 from openpyxl import load_workbook
-from openpyxl.worksheet.worksheet import Worksheet
+
+# Optional faster Excel reader (Rust calamine); openpyxl is used without it
+try:
+    from python_calamine import CalamineWorkbook
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
 
 from .models import (
     ParsedORGA, HotelStay, TransferVoucher, TransferLeg,
@@ -24,6 +34,30 @@ from .name_mapper import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _norm_key(name: str) -> str:
+    """Normalized (stripped, lowercased) key for grouping/looking up a supplier."""
+    return name.strip().lower()
+
+
+def add_supplier_info(vouchers: list) -> None:
+    """Fill address/phone/gps on parsed vouchers in one pass after parsing.
+    
+    Each distinct supplier is looked up once, however many vouchers share it.
+    The memo only lives for this call, so suppliers.yaml edits are picked
+    up by the next parse.
+    """
+    infos: Dict[str, Mapping[str, Any]] = {}
+    for voucher in vouchers:
+        key = _norm_key(voucher.supplier)
+        info = infos.get(key)
+        if info is None:
+            info = infos[key] = get_supplier_info(key)
+        voucher.address = info.get("address", "")
+        voucher.phone = info.get("phone", "")
+        voucher.gps = info.get("gps", "")
+
+
 def detect_region(file_path: str) -> str:
     """Detect if this is an SA (South Africa) or EU (Europe) trip.
     
@@ -108,16 +142,16 @@ class ColumnMapping:
         self.transfer_invoice = 36
 
 
-def detect_columns(ws: Worksheet, header_row: int) -> ColumnMapping:
-    """Auto-detect column positions from header row."""
+def detect_columns(header_values: tuple, header_row: int) -> ColumnMapping:
+    """Auto-detect column positions from the header row's values."""
     mapping = ColumnMapping()
     
-    # Read all headers
+    # Read all headers (built in column order, so iteration below is sorted)
     headers = {}
-    for col in range(1, min(60, ws.max_column + 1)):
-        val = ws.cell(header_row, col).value
+    for col, val in enumerate(header_values[:59], start=1):
         if val:
-            headers[col] = str(val).lower().strip()
+            # Lowercased once and interned - compared against many literals below
+            headers[col] = sys.intern(str(val).lower().strip())
     
     logger.info(f"Detecting columns from header row {header_row}, found {len(headers)} headers")
     
@@ -127,9 +161,7 @@ def detect_columns(ws: Worksheet, header_row: int) -> ColumnMapping:
     activity_start = None
     transfer_start = None
     
-    for col, header in sorted(headers.items()):
-        header_lower = header.lower()
-        
+    for col, header_lower in headers.items():
         # Hotel section (columns 1-10 typically)
         if header_lower == "days":
             mapping.days = col
@@ -171,7 +203,7 @@ def detect_columns(ws: Worksheet, header_row: int) -> ColumnMapping:
             if not activity_start:
                 # Look back for supplier
                 for c in range(col - 1, max(0, col - 5), -1):
-                    if headers.get(c, "").lower() == "supplier":
+                    if headers.get(c) == "supplier":
                         mapping.activity_supplier = c
                         activity_start = c
                         break
@@ -185,7 +217,7 @@ def detect_columns(ws: Worksheet, header_row: int) -> ColumnMapping:
             if not transfer_start:
                 # Look back for supplier
                 for c in range(col - 1, max(0, col - 3), -1):
-                    if headers.get(c, "").lower() == "supplier":
+                    if headers.get(c) == "supplier":
                         mapping.transfer_supplier = c
                         transfer_start = c
                         break
@@ -204,9 +236,7 @@ def detect_columns(ws: Worksheet, header_row: int) -> ColumnMapping:
     
     # Handle "Notes" and "Status" columns - they appear in each section
     # Find them relative to the section starts
-    for col, header in sorted(headers.items()):
-        header_lower = header.lower()
-        
+    for col, header_lower in headers.items():
         if header_lower == "notes" or header_lower == "notes ":
             # Determine which section this Notes belongs to
             if transfer_start and col > transfer_start:
@@ -294,14 +324,91 @@ COL_TRANSFER_STATUS = 35
 COL_TRANSFER_INVOICE = 36
 
 
-def get_cell_value(ws: Worksheet, row: int, col: int) -> Optional[str]:
-    """Get cell value as string, handling None and whitespace."""
-    val = ws.cell(row, col).value
+def _normalize(val: Any) -> Optional[str]:
+    """Normalize a raw cell value: datetimes pass through, text is stripped."""
     if val is None:
         return None
     if isinstance(val, datetime):
         return val
-    return str(val).strip() if str(val).strip() else None
+    text = str(val).strip()
+    if not text:
+        return None
+    # Short values (room, board, status, ...) repeat on most rows - share one copy
+    return sys.intern(text) if len(text) <= 32 else text
+
+
+# Rows buffered from the top of the sheet for metadata and header detection
+# (header search covers rows 1-29, data start up to 9 rows below the header)
+HEAD_ROWS = 40
+
+
+def _split_lines(val: Optional[str]) -> Tuple[str, ...]:
+    """Split a multi-line cell into its stripped, non-blank lines."""
+    if not val:
+        return ()
+    # Fast path: most cells hold a single line
+    if '\n' not in val:
+        val = val.strip()
+        return (val,) if val else ()
+    return tuple(line for line in (part.strip() for part in val.split('\n')) if line)
+
+
+class DataRow(NamedTuple):
+    """One dated ORGA row, with cell values already normalized."""
+    row: int
+    date: date
+    days: Optional[str]
+    # Hotel
+    region_city: Optional[str]
+    hotel_supplier: Optional[str]
+    room: Optional[str]
+    board: Optional[str]
+    hotel_status: Optional[str]
+    hotel_notes: Optional[str]
+    # Golf
+    golf_supplier: Optional[str]
+    golf_course: Optional[str]
+    tee_time: Optional[str]
+    golf_cart: Optional[str]
+    rental_set: Optional[str]
+    golf_notes: Optional[str]
+    # Activity
+    activity_supplier: Optional[str]
+    activity_name: Optional[str]
+    activity_time: Optional[str]
+    activity_notes: Optional[str]
+    # Transfer
+    transfer_supplier: Optional[str]
+    transfer_route: Optional[str]
+    service_type: Optional[str]
+    pickup_time: Optional[str]
+    dropoff_time: Optional[str]
+    flight_num: Optional[str]
+    flight_time: Optional[str]
+    transfer_notes: Optional[str]
+    transfer_status: Optional[str]
+    # Multi-line cells, split once at collection time (see _split_lines).
+    # Times/flights keep blank lines so they stay aligned by position.
+    activity_suppliers: Tuple[str, ...]
+    activity_names: Tuple[str, ...]
+    activity_times: Tuple[str, ...]
+    activity_notes_lines: Tuple[str, ...]
+    transfer_suppliers: Tuple[str, ...]
+    transfer_routes: Tuple[str, ...]
+    pickup_times: Tuple[str, ...]
+    dropoff_times: Tuple[str, ...]
+    flight_nums: Tuple[str, ...]
+
+
+def get_row_value(values: tuple, col: Optional[int]) -> Optional[str]:
+    """Get a normalized value from a row tuple (1-based column).
+    
+    Text is stripped and datetimes pass through; missing columns, empty
+    cells and whitespace-only cells give None.
+    """
+    if not col or col > len(values):
+        return None
+    return _normalize(values[col - 1])
 
 
 def parse_date(val: Any) -> Optional[date]:
@@ -312,219 +419,400 @@ def parse_date(val: Any) -> Optional[date]:
         return val.date()
     if isinstance(val, date):
         return val
+    text = str(val)
+    # Fast path for zero-padded "YYYY-MM-DD" / "DD.MM.YYYY" without strptime
+    if len(text) == 10:
+        try:
+            if text[4] == '-' and text[7] == '-':
+                digits = text[:4] + text[5:7] + text[8:]
+                if digits.isdigit():
+                    return date(int(text[:4]), int(text[5:7]), int(text[8:]))
+            elif text[2] == '.' and text[5] == '.':
+                digits = text[:2] + text[3:5] + text[6:]
+                if digits.isdigit():
+                    return date(int(text[6:]), int(text[3:5]), int(text[:2]))
+        except ValueError:
+            return None  # e.g. 2024-02-30, which strptime rejects as well
     # Try parsing string formats
     try:
-        return datetime.strptime(str(val), "%Y-%m-%d").date()
+        return datetime.strptime(text, "%Y-%m-%d").date()
     except ValueError:
         pass
     try:
-        return datetime.strptime(str(val), "%d.%m.%Y").date()
+        return datetime.strptime(text, "%d.%m.%Y").date()
     except ValueError:
         pass
     return None
 
 
-def find_header_row(ws: Worksheet) -> int:
-    """Find the row containing column headers."""
-    for row in range(1, 30):  # Extended range to find headers in different formats
+def find_header_row(rows: List[tuple]) -> int:
+    """Find the row containing column headers.
+    
+    Args:
+        rows: Value tuples of the first rows of the sheet (row 1 first)
+    """
+    # Extended range to find headers in different formats
+    for row, values in enumerate(rows[:29], start=1):
         # Look for the "Days" header in column 1
-        val = get_cell_value(ws, row, COL_DAYS)
+        val = get_row_value(values, COL_DAYS)
         if val and str(val).lower() == "days":
             return row
     return 10  # Default based on analysis
 
 
-def find_data_start_row(ws: Worksheet, header_row: int) -> int:
-    """Find the first row with actual data after headers."""
-    for row in range(header_row + 1, header_row + 10):
-        date_val = get_cell_value(ws, row, COL_DATE)
+def find_data_start_row(rows: List[tuple], header_row: int) -> int:
+    """Find the first row with actual data after headers.
+    
+    Args:
+        rows: Value tuples of the first rows of the sheet (row 1 first)
+        header_row: Row number returned by find_header_row
+    """
+    for row, values in enumerate(rows[header_row:header_row + 9], start=header_row + 1):
+        date_val = get_row_value(values, COL_DATE)
         if date_val and parse_date(date_val):
             # Skip example rows
-            days_val = get_cell_value(ws, row, COL_DAYS)
+            days_val = get_row_value(values, COL_DAYS)
             if days_val and str(days_val).lower() == "e.g":
                 continue
             return row
     return header_row + 2
 
 
-def is_car_rental_row(route_val: str) -> bool:
-    """Check if a transfer row is actually a car rental."""
-    if not route_val:
-        return False
-    route_lower = route_val.lower()
-    return "rental car" in route_lower or "group o" in route_lower or "group " in route_lower
+# Transfer route: "<pickup> - <dropoff> [incl. <extras>]", split at the first "-".
+# "rest" is everything after the dash; "dropoff"/"incl" dissect it further.
+_ROUTE_RE = re.compile(
+    r"\s*(?P<pickup>[^-]*?)\s*-\s*"
+    r"(?P<rest>(?P<dropoff>.*?)(?:\s*incl\.\s*(?P<incl>.*?))?)\s*$",
+    re.IGNORECASE,
+)
+# Route prefixes meaning "transfer to <rest>" rather than a pickup location
+_TRF_PREFIXES = frozenset({"trf", "transfer"})
 
 
-def parse_orga(file_path: str) -> ParsedORGA:
-    """Parse an ORGA Excel file and extract all service data."""
-    logger.info(f"Parsing ORGA file: {file_path}")
-    
-    wb = load_workbook(file_path, data_only=True)
+# Activity/restaurant classification, each run once over the lowercased
+# "supplier activity notes" text. Plain substrings on purpose (no word
+# boundaries) so plurals like "tours" or "drives" still count.
+
+# Meal keywords that indicate a restaurant voucher
+_MEAL_RE = re.compile(r"dinner|lunch")
+# Keywords that indicate an activity (even at a restaurant-sounding venue)
+_ACTIVITY_RE = re.compile(
+    r"tasting|tour|tickets|watching|drive|panorama|route|safari"
+    r"|cave|elephant|meerkat|helicopter|boat|cruise|island"
+)
+# Keywords that make a meal entry an activity instead (e.g. wine tasting)
+_MEAL_ACTIVITY_RE = re.compile(r"tasting|tour|tickets|watching")
+
+
+# Car rental routes ("Rental car ...", "Group C ..."); "group " also covers "group o"
+_CAR_RENTAL_RE = re.compile(r"rental car|group ", re.IGNORECASE)
+
+
+def sheet_has_data(rows: List[tuple]) -> bool:
+    """Check if a sheet has data in the hotel supplier column (5).
     
-    # Find the correct sheet - prefer sheets marked as "correct" or with actual data
-    ws = None
+    Args:
+        rows: Value tuples of the first rows of the sheet (row 1 first) -
+            a small streamed buffer, not random ws.cell() access
+    """
+    # Try different header row positions (10 or 19)
+    for header_row in (10, 19):
+        for data_row in (header_row + 2, header_row + 1):
+            if data_row <= len(rows):
+                hotel = get_row_value(rows[data_row - 1], 5)
+                if hotel and str(hotel).lower() not in ('hotel supplier', 'e.g', 'example'):
+                    return True
+    return False
+
+
+# Rows handed to sheet_has_data (covers the data rows below both header positions)
+PROBE_ROWS = 21
+
+
+def select_orga_sheet(
+    sheet_names: List[str],
+    first_rows: Callable[[str], List[tuple]]
+) -> Optional[str]:
+    """Find the correct sheet - prefer sheets marked as "correct" or with actual data.
+    
+    Args:
+        sheet_names: Sheet names in workbook order
+        first_rows: Returns the first PROBE_ROWS value tuples of a sheet
+    
+    Returns:
+        Name of the sheet to parse, or None if there is no Orga sheet
+    """
     orga_sheets = []
     
-    for sheet_name in wb.sheetnames:
+    for sheet_name in sheet_names:
         if "orga" in sheet_name.lower():
             orga_sheets.append(sheet_name)
             # Prefer sheets with "correct" in the name
             if "correct" in sheet_name.lower():
-                ws = wb[sheet_name]
                 logger.info(f"Using sheet (marked as correct): {sheet_name}")
-                break
+                return sheet_name
     
     # If no "correct" sheet, find one with actual data
-    if ws is None and orga_sheets:
-        for sheet_name in orga_sheets:
-            test_ws = wb[sheet_name]
-            # Check if this sheet has data in the supplier columns
-            # Try different header row positions (10 or 19)
-            for header_row in [10, 19]:
-                for data_row in [header_row + 2, header_row + 1]:
-                    if data_row <= test_ws.max_row:
-                        # Check hotel supplier column (5)
-                        hotel = test_ws.cell(data_row, 5).value
-                        if hotel and str(hotel).lower() not in ['hotel supplier', 'e.g', 'example']:
-                            ws = test_ws
-                            logger.info(f"Using sheet (has data): {sheet_name}")
-                            break
-                if ws:
-                    break
-            if ws:
-                break
+    for sheet_name in orga_sheets:
+        if sheet_has_data(first_rows(sheet_name)):
+            logger.info(f"Using sheet (has data): {sheet_name}")
+            return sheet_name
+    
+    # Fall back to first Orga sheet if none had data
+    if orga_sheets:
+        logger.info(f"Using sheet (first Orga): {orga_sheets[0]}")
+        return orga_sheets[0]
+    
+    return None
+
+
+def _calamine_value(val: Any) -> Any:
+    """Match openpyxl's cell values: calamine reads every number as a float."""
+    if isinstance(val, float) and val.is_integer():
+        return int(val)
+    return val
+
+
+def _load_rows(file_path: str) -> Iterator[tuple]:
+    """Stream the value tuples of the ORGA sheet, row 1 first.
+    
+    Uses python-calamine when it is installed, otherwise openpyxl in
+    read-only mode. The sheet is chosen on the first next() call; close()
+    the iterator to release the workbook when stopping early.
+    """
+    if HAS_CALAMINE:
+        wb = CalamineWorkbook.from_path(file_path)
+        try:
+            sheet_rows: Dict[str, List[tuple]] = {}
+            
+            def read_sheet(name: str) -> List[tuple]:
+                if name not in sheet_rows:
+                    # Keep leading empty rows/columns so row/column numbers match Excel
+                    sheet = wb.get_sheet_by_name(name)
+                    sheet_rows[name] = [
+                        tuple(map(_calamine_value, values))
+                        for values in sheet.to_python(skip_empty_area=False)
+                    ]
+                return sheet_rows[name]
+            
+            sheet_name = select_orga_sheet(
+                wb.sheet_names, lambda name: read_sheet(name)[:PROBE_ROWS]
+            )
+            if sheet_name is None:
+                sheet_name = wb.sheet_names[0]
+                logger.info(f"Using first sheet: {sheet_name}")
+            yield from read_sheet(sheet_name)
+        finally:
+            # close() exists since python-calamine 0.2; older versions hold no handle
+            close = getattr(wb, "close", None)
+            if close is not None:
+                close()
+        return
+    
+    # Read-only mode streams the sheet XML instead of building a Cell object
+    # for every cell; the workbook is closed once the rows have been read.
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    
+    def first_rows(name: str) -> List[tuple]:
+        ws = wb[name]
+        # A stale <dimension> would trim the probe to its columns (e.g. A1:A1)
+        ws.reset_dimensions()
+        return list(ws.iter_rows(max_row=PROBE_ROWS, values_only=True))
+    
+    try:
+        sheet_name = select_orga_sheet(wb.sheetnames, first_rows)
+        if sheet_name is None:
+            ws = wb.active
+            logger.info(f"Using active sheet: {ws.title}")
+        else:
+            ws = wb[sheet_name]
         
-        # Fall back to first Orga sheet if none had data
-        if ws is None:
-            ws = wb[orga_sheets[0]]
-            logger.info(f"Using sheet (first Orga): {orga_sheets[0]}")
-    
-    if ws is None:
-        ws = wb.active
-        logger.info(f"Using active sheet: {ws.title}")
-    
-    result = ParsedORGA()
-    
-    # Detect region (SA or EU) from filename
-    result.region = detect_region(file_path)
-    logger.info(f"Detected region: {result.region}")
-    
-    # Extract metadata from header rows
-    for row in range(1, 10):
-        label = get_cell_value(ws, row, 1)
-        value = get_cell_value(ws, row, 4)
-        if label and value:
-            label_lower = label.lower()
-            if "lead name" in label_lower:
-                result.client_name = str(value)
-            elif "pax" in label_lower:
-                try:
-                    result.pax = int(value)
-                except ValueError:
-                    pass
-            elif "dates" in label_lower:
-                result.dates = str(value)
-            elif "trip number" in label_lower:
-                result.trip_number = str(value)
-    
-    # Find header and data rows
-    header_row = find_header_row(ws)
-    data_start = find_data_start_row(ws, header_row)
-    logger.info(f"Header row: {header_row}, Data starts: {data_start}")
-    
-    # Auto-detect column positions from header row
-    cols = detect_columns(ws, header_row)
-    
-    # Collect all data rows using detected column positions
-    data_rows = []
-    for row in range(data_start, ws.max_row + 1):
-        date_val = get_cell_value(ws, row, cols.date)
-        current_date = parse_date(date_val)
+        # Drop the declared dimensions so iteration runs to the end of the sheet
+        # XML instead of padding/truncating to a (possibly stale) max_row; rows
+        # can then be shorter than the widest row, which get_row_value handles.
+        # Probed sheets were already reset in first_rows(); the active or
+        # "correct" sheet may not have been probed, so reset here as well.
+        ws.reset_dimensions()
+        yield from ws.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def parse_orga(file_path: str) -> ParsedORGA:
+    """Parse an ORGA Excel file and extract all service data."""
+    logger.info(f"Parsing ORGA file: {file_path}")
+    
+    # Stream the sheet once: buffer the top rows for metadata and header
+    # detection, then keep consuming the same iterator for the data rows
+    rows = _load_rows(file_path)
+    try:
+        head = list(islice(rows, HEAD_ROWS))
         
-        if current_date is None:
-            # Check if this is an "action" or notes row
-            col1_val = get_cell_value(ws, row, 1)
-            if col1_val and ("action" in str(col1_val).lower() or "book" in str(col1_val).lower()):
-                break  # End of data rows
-            continue
+        result = ParsedORGA()
+        
+        # Detect region (SA or EU) from filename
+        result.region = detect_region(file_path)
+        logger.info(f"Detected region: {result.region}")
+        
+        # Extract metadata from header rows
+        for values in head[:9]:
+            label = get_row_value(values, 1)
+            value = get_row_value(values, 4)
+            if label and value:
+                label_lower = label.lower()
+                if "lead name" in label_lower:
+                    result.client_name = str(value)
+                elif "pax" in label_lower:
+                    try:
+                        result.pax = int(value)
+                    except ValueError:
+                        pass
+                elif "dates" in label_lower:
+                    result.dates = str(value)
+                elif "trip number" in label_lower:
+                    result.trip_number = str(value)
+        
+        # Find header and data rows
+        header_row = find_header_row(head)
+        data_start = find_data_start_row(head, header_row)
+        logger.info(f"Header row: {header_row}, Data starts: {data_start}")
+        
+        # Auto-detect column positions from header row
+        header_values = head[header_row - 1] if header_row <= len(head) else ()
+        cols = detect_columns(header_values, header_row)
+        
+        # Collect all data rows using detected column positions.
+        # Each field is read from the row's value tuple (one read per cell).
+        data_rows = []
+        # Rows each section parser actually needs, bucketed in this same pass so
+        # the parsers below don't each re-scan the whole itinerary.
+        # Hotels keep the full list (stays are grouped over consecutive days).
+        transfer_rows = []
+        car_rental_rows = []
+        activity_rows = []
+        golf_rows = []
+        for row, values in enumerate(chain(head[data_start - 1:], rows), start=data_start):
+            current_date = parse_date(get_row_value(values, cols.date))
+            
+            if current_date is None:
+                # Check if this is an "action" or notes row
+                col1_val = get_row_value(values, 1)
+                if col1_val:
+                    col1_lower = str(col1_val).lower()
+                    if "action" in col1_lower or "book" in col1_lower:
+                        break  # End of data rows
+                continue
+            
+            # Multi-line columns are read first so they can be split once below
+            activity_supplier = get_row_value(values, cols.activity_supplier)
+            activity_name = get_row_value(values, cols.activity_name)
+            activity_time = get_row_value(values, cols.activity_time)
+            activity_notes = get_row_value(values, cols.activity_notes)
+            transfer_supplier = get_row_value(values, cols.transfer_supplier)
+            transfer_route = get_row_value(values, cols.transfer_route)
+            pickup_time = get_row_value(values, cols.pickup_time)
+            dropoff_time = get_row_value(values, cols.dropoff_time)
+            flight_num = get_row_value(values, cols.flight_num)
+            
+            record = DataRow(
+                row=row,
+                date=current_date,
+                days=get_row_value(values, cols.days),
+                # Hotel
+                region_city=get_row_value(values, cols.region_city),
+                hotel_supplier=get_row_value(values, cols.hotel_supplier),
+                room=get_row_value(values, cols.room),
+                board=get_row_value(values, cols.board),
+                hotel_status=get_row_value(values, cols.hotel_status),
+                hotel_notes=get_row_value(values, cols.hotel_notes),
+                # Golf
+                golf_supplier=get_row_value(values, cols.golf_supplier),
+                golf_course=get_row_value(values, cols.golf_course),
+                tee_time=get_row_value(values, cols.tee_time),
+                golf_cart=get_row_value(values, cols.golf_cart),
+                rental_set=get_row_value(values, cols.rental_set),
+                golf_notes=get_row_value(values, cols.golf_notes),
+                # Activity
+                activity_supplier=activity_supplier,
+                activity_name=activity_name,
+                activity_time=activity_time,
+                activity_notes=activity_notes,
+                # Transfer
+                transfer_supplier=transfer_supplier,
+                transfer_route=transfer_route,
+                service_type=get_row_value(values, cols.service_type),
+                pickup_time=pickup_time,
+                dropoff_time=dropoff_time,
+                flight_num=flight_num,
+                flight_time=get_row_value(values, cols.flight_time),
+                transfer_notes=get_row_value(values, cols.transfer_notes),
+                transfer_status=get_row_value(values, cols.transfer_status),
+                # Pre-split multi-line cells
+                activity_suppliers=_split_lines(activity_supplier),
+                activity_names=_split_lines(activity_name),
+                activity_times=_split_lines(activity_time),
+                activity_notes_lines=_split_lines(activity_notes),
+                transfer_suppliers=_split_lines(transfer_supplier),
+                transfer_routes=_split_lines(transfer_route),
+                pickup_times=tuple((pickup_time or "").split('\n')),
+                dropoff_times=tuple((dropoff_time or "").split('\n')),
+                flight_nums=tuple((flight_num or "").split('\n')),
+            )
+            data_rows.append(record)
+            
+            if record.transfer_supplier:
+                transfer_rows.append(record)
+            # Car rentals are usually only a couple of rows per trip
+            if record.transfer_route and _CAR_RENTAL_RE.search(record.transfer_route):
+                car_rental_rows.append(record)
+            if record.activity_supplier:
+                activity_rows.append(record)
+            if record.golf_supplier or record.golf_course:
+                golf_rows.append(record)
         
-        data_rows.append({
-            "row": row,
-            "date": current_date,
-            "days": get_cell_value(ws, row, cols.days),
-            # Hotel
-            "region_city": get_cell_value(ws, row, cols.region_city),
-            "hotel_supplier": get_cell_value(ws, row, cols.hotel_supplier),
-            "room": get_cell_value(ws, row, cols.room),
-            "board": get_cell_value(ws, row, cols.board),
-            "hotel_status": get_cell_value(ws, row, cols.hotel_status),
-            "hotel_notes": get_cell_value(ws, row, cols.hotel_notes),
-            # Golf
-            "golf_supplier": get_cell_value(ws, row, cols.golf_supplier),
-            "golf_course": get_cell_value(ws, row, cols.golf_course),
-            "tee_time": get_cell_value(ws, row, cols.tee_time),
-            "golf_cart": get_cell_value(ws, row, cols.golf_cart) if cols.golf_cart else None,
-            "rental_set": get_cell_value(ws, row, cols.rental_set) if cols.rental_set else None,
-            "golf_notes": get_cell_value(ws, row, cols.golf_notes) if cols.golf_notes else None,
-            # Activity
-            "activity_supplier": get_cell_value(ws, row, cols.activity_supplier),
-            "activity_name": get_cell_value(ws, row, cols.activity_name) if cols.activity_name else None,
-            "activity_time": get_cell_value(ws, row, cols.activity_time) if cols.activity_time else None,
-            "activity_notes": get_cell_value(ws, row, cols.activity_notes) if cols.activity_notes else None,
-            # Transfer
-            "transfer_supplier": get_cell_value(ws, row, cols.transfer_supplier),
-            "transfer_route": get_cell_value(ws, row, cols.transfer_route) if cols.transfer_route else None,
-            "service_type": get_cell_value(ws, row, cols.service_type) if cols.service_type else None,
-            "pickup_time": get_cell_value(ws, row, cols.pickup_time) if cols.pickup_time else None,
-            "dropoff_time": get_cell_value(ws, row, cols.dropoff_time) if cols.dropoff_time else None,
-            "flight_num": get_cell_value(ws, row, cols.flight_num) if cols.flight_num else None,
-            "flight_time": get_cell_value(ws, row, cols.flight_time) if cols.flight_time else None,
-            "transfer_notes": get_cell_value(ws, row, cols.transfer_notes) if cols.transfer_notes else None,
-            "transfer_status": get_cell_value(ws, row, cols.transfer_status) if cols.transfer_status else None,
-        })
+    finally:
+        # Also on parse errors - releases the workbook and its file handle
+        rows.close()
     
     logger.info(f"Found {len(data_rows)} data rows")
     
     # Log first data row for debugging
     if data_rows:
         first = data_rows[0]
-        logger.info(f"First data row sample - Hotel: {first.get('hotel_supplier')}, Activity: {first.get('activity_supplier')}, Transfer: {first.get('transfer_supplier')}")
+        logger.info(f"First data row sample - Hotel: {first.hotel_supplier}, Activity: {first.activity_supplier}, Transfer: {first.transfer_supplier}")
     
     # Parse hotels - group consecutive stays at the same hotel
     result.hotels = parse_hotels(data_rows)
     logger.info(f"Parsed {len(result.hotels)} hotel stays")
     
     # Parse transfers - group by supplier
-    result.transfers = parse_transfers(data_rows)
+    result.transfers = parse_transfers(transfer_rows)
     logger.info(f"Parsed {len(result.transfers)} transfer vouchers")
     
     # Parse car rentals
-    result.car_rentals = parse_car_rentals(data_rows)
+    result.car_rentals = parse_car_rentals(car_rental_rows)
     logger.info(f"Parsed {len(result.car_rentals)} car rental vouchers")
     
-    # Parse activities - group by supplier
-    result.activities = parse_activities(data_rows)
+    # Parse activities (grouped by supplier) and restaurants - same columns
+    result.activities, result.restaurants = parse_activities_and_restaurants(activity_rows)
     logger.info(f"Parsed {len(result.activities)} activity vouchers")
-    
-    # Parse restaurants
-    result.restaurants = parse_restaurants(data_rows)
     logger.info(f"Parsed {len(result.restaurants)} restaurant vouchers")
     
     # Parse golf
-    result.golf = parse_golf(data_rows)
+    result.golf = parse_golf(golf_rows)
     logger.info(f"Parsed {len(result.golf)} golf vouchers")
     
     return result
 
 
-def parse_hotels(data_rows: List[Dict]) -> List[HotelStay]:
+def parse_hotels(data_rows: List[DataRow]) -> List[HotelStay]:
     """Parse hotel stays from data rows, grouping consecutive nights."""
     hotels = []
     current_hotel = None
     current_start = None
     
     for i, row in enumerate(data_rows):
-        hotel_supplier = row.get("hotel_supplier")
+        hotel_supplier = row.hotel_supplier
         
         if hotel_supplier:
             # Clean up supplier name (remove trailing whitespace/newlines)
@@ -534,7 +822,7 @@ def parse_hotels(data_rows: List[Dict]) -> List[HotelStay]:
                 # New hotel stay - save previous if exists
                 if current_hotel is not None:
                     # Find the checkout date (current row's date)
-                    checkout = row["date"]
+                    checkout = row.date
                     nights = (checkout - current_start).days
                     
                     hotels.append(HotelStay(
@@ -545,32 +833,30 @@ def parse_hotels(data_rows: List[Dict]) -> List[HotelStay]:
                         check_in=current_start,
                         check_out=checkout,
                         nights=nights,
-                        notes=current_notes or "",
+                        notes="\n".join(current_notes),
                         status=current_status or ""
                     ))
                 
                 # Start new hotel
                 current_hotel = hotel_supplier
-                current_start = row["date"]
-                current_region = row.get("region_city", "")
-                current_room = row.get("room", "")
-                current_board = row.get("board", "")
-                current_notes = row.get("hotel_notes", "")
-                current_status = row.get("hotel_status", "")
+                current_start = row.date
+                current_region = row.region_city
+                current_room = row.room
+                current_board = row.board
+                # Notes from every night of the stay, joined when the stay is saved
+                current_notes = [row.hotel_notes] if row.hotel_notes else []
+                current_status = row.hotel_status
             else:
                 # Same hotel - update room/notes if provided
-                if row.get("room"):
-                    current_room = row.get("room")
-                if row.get("hotel_notes"):
-                    if current_notes:
-                        current_notes += "\n" + row.get("hotel_notes")
-                    else:
-                        current_notes = row.get("hotel_notes")
+                if row.room:
+                    current_room = row.room
+                if row.hotel_notes:
+                    current_notes.append(row.hotel_notes)
     
     # Don't forget the last hotel
     if current_hotel is not None:
         # For the last hotel, checkout is day after the last row
-        last_date = data_rows[-1]["date"] if data_rows else current_start
+        last_date = data_rows[-1].date if data_rows else current_start
         # Find next day for checkout
         from datetime import timedelta
         checkout = last_date + timedelta(days=1)
@@ -584,131 +870,113 @@ def parse_hotels(data_rows: List[Dict]) -> List[HotelStay]:
             check_in=current_start,
             check_out=checkout,
             nights=nights,
-            notes=current_notes or "",
+            notes="\n".join(current_notes),
             status=current_status or ""
         ))
     
     # Add supplier info
-    for hotel in hotels:
-        info = get_supplier_info(hotel.supplier)
-        hotel.address = info.get("address", "")
-        hotel.phone = info.get("phone", "")
-        hotel.gps = info.get("gps", "")
+    add_supplier_info(hotels)
     
     return hotels
 
 
-def parse_transfers(data_rows: List[Dict]) -> List[TransferVoucher]:
+def parse_transfers(data_rows: List[DataRow]) -> List[TransferVoucher]:
     """Parse transfers from data rows, grouping by supplier."""
     transfers_by_supplier: Dict[str, TransferVoucher] = {}
     
     for row in data_rows:
-        supplier = row.get("transfer_supplier")
-        route = row.get("transfer_route")
-        
-        if not supplier:
-            continue
-        
-        # Handle multi-line suppliers/routes
-        suppliers = [s.strip() for s in supplier.split('\n') if s.strip()]
-        routes = [r.strip() for r in (route or "").split('\n') if r.strip()]
-        pickup_times = (row.get("pickup_time") or "").split('\n')
-        dropoff_times = (row.get("dropoff_time") or "").split('\n')
-        flight_nums = (row.get("flight_num") or "").split('\n')
+        # Multi-line suppliers/routes (already split per line)
+        routes = row.transfer_routes
+        pickup_times = row.pickup_times
+        dropoff_times = row.dropoff_times
+        flight_nums = row.flight_nums
         
-        for idx, sup in enumerate(suppliers):
+        for idx, sup in enumerate(row.transfer_suppliers):
             rt = routes[idx] if idx < len(routes) else ""
             
             # Skip car rental entries
-            if is_car_rental_row(rt):
+            if _CAR_RENTAL_RE.search(rt):
                 continue
             
             # Skip flight-only entries (Airlink, etc.) - they might be handled separately
-            if "flight" in rt.lower() and "airport" not in rt.lower():
+            route_lower = rt.lower()
+            if "flight" in route_lower and "airport" not in route_lower:
                 continue
                 
-            sup_key = sup.lower().strip()
+            sup_key = _norm_key(sup)
             
-            if sup_key not in transfers_by_supplier:
-                info = get_supplier_info(sup)
-                transfers_by_supplier[sup_key] = TransferVoucher(
+            voucher = transfers_by_supplier.get(sup_key)
+            if voucher is None:
+                info = get_supplier_info(sup_key)
+                voucher = TransferVoucher(
                     supplier=sup,
                     address=info.get("address", ""),
                     phone=info.get("phone", ""),
                     gps=info.get("gps", "")
                 )
+                transfers_by_supplier[sup_key] = voucher
             
             # Parse pickup and dropoff from route
             pickup_loc = ""
             dropoff_loc = ""
             route_notes = ""
             
-            if "-" in rt:
-                parts = rt.split("-", 1)
-                if len(parts) == 2:
-                    first_part = parts[0].strip()
-                    second_part = parts[1].strip()
-                    
-                    # Check if it's "Trf - Location" format
-                    if first_part.lower() in ["trf", "transfer"]:
-                        dropoff_loc = second_part
-                    # Check if it has "incl." with additional info
-                    elif "incl." in second_part.lower():
-                        incl_parts = second_part.split("incl.", 1)
-                        dropoff_loc = incl_parts[0].strip()
-                        route_notes = "Includes: " + incl_parts[1].strip() if len(incl_parts) > 1 else ""
-                        pickup_loc = first_part
-                    else:
-                        pickup_loc = first_part
-                        dropoff_loc = second_part
-            else:
+            match = _ROUTE_RE.match(rt)
+            if match is None:
                 dropoff_loc = rt
+            # Check if it's "Trf - Location" format
+            elif match["pickup"].lower() in _TRF_PREFIXES:
+                dropoff_loc = match["rest"]
+            # Check if it has "incl." with additional info
+            elif match["incl"] is not None:
+                pickup_loc = match["pickup"]
+                dropoff_loc = match["dropoff"]
+                route_notes = "Includes: " + match["incl"]
+            else:
+                pickup_loc = match["pickup"]
+                dropoff_loc = match["rest"]
             
             # Combine notes
-            all_notes = []
-            if route_notes:
-                all_notes.append(route_notes)
-            if row.get("transfer_notes"):
-                all_notes.append(row.get("transfer_notes"))
+            transfer_notes = row.transfer_notes
+            if route_notes and transfer_notes:
+                notes = route_notes + "\n" + transfer_notes
+            else:
+                notes = route_notes or transfer_notes or ""
             
             leg = TransferLeg(
-                date=row["date"],
+                date=row.date,
                 pickup_location=pickup_loc,
                 dropoff_location=dropoff_loc,
                 pickup_time=pickup_times[idx] if idx < len(pickup_times) else "",
                 dropoff_time=dropoff_times[idx] if idx < len(dropoff_times) else "",
                 flight_number=flight_nums[idx] if idx < len(flight_nums) else "",
-                notes="\n".join(all_notes)
+                notes=notes
             )
-            transfers_by_supplier[sup_key].legs.append(leg)
+            voucher.legs.append(leg)
     
     return list(transfers_by_supplier.values())
 
 
-def parse_car_rentals(data_rows: List[Dict]) -> List[CarRentalVoucher]:
+def parse_car_rentals(data_rows: List[DataRow]) -> List[CarRentalVoucher]:
     """Parse car rental information from data rows."""
     car_rentals = []
     car_rental_data = {}
     
     for row in data_rows:
-        route = row.get("transfer_route")
-        if not route:
-            continue
-        
-        routes = [r.strip() for r in route.split('\n') if r.strip()]
-        
-        for rt in routes:
-            if is_car_rental_row(rt):
+        for rt in row.transfer_routes:
+            if _CAR_RENTAL_RE.search(rt):
+                route_lower = rt.lower()
+                
                 # Extract car group info
-                if "group" in rt.lower():
+                if "group" in route_lower:
                     if "car_group" not in car_rental_data:
                         car_rental_data["car_group"] = rt
-                        car_rental_data["pickup_date"] = row["date"]
-                    car_rental_data["dropoff_date"] = row["date"]
+                        car_rental_data["pickup_date"] = row.date
+                    car_rental_data["dropoff_date"] = row.date
                     
-                if "collect" in rt.lower() or "pickup" in rt.lower():
+                if "collect" in route_lower or "pickup" in route_lower:
                     car_rental_data["pickup_location"] = rt
-                if "drop" in rt.lower() or "return" in rt.lower():
+                if "drop" in route_lower or "return" in route_lower:
                     car_rental_data["dropoff_location"] = rt
     
     if car_rental_data.get("car_group"):
@@ -733,79 +1001,84 @@ def parse_car_rentals(data_rows: List[Dict]) -> List[CarRentalVoucher]:
     return car_rentals
 
 
-def parse_activities(data_rows: List[Dict]) -> List[ActivityVoucher]:
-    """Parse activities from data rows, grouping by supplier.
+def parse_activities_and_restaurants(
+    data_rows: List[DataRow]
+) -> Tuple[List[ActivityVoucher], List[RestaurantVoucher]]:
+    """Parse activities (grouped by supplier) and restaurants from data rows.
     
-    IMPORTANT: Skip entries marked with (TR) - these are table reservations only.
+    Both come from the activity columns, so they are classified in one pass:
+    meals (dinner/lunch) become restaurant vouchers, everything else becomes
+    an activity. A meal that is really an activity (e.g. wine tasting) is
+    handled as an activity.
+    
+    IMPORTANT: Skip entries marked with (TR) - these are table reservations only,
+    not prepaid services, so they don't need vouchers.
     """
     activities_by_supplier: Dict[str, ActivityVoucher] = {}
-    
-    # Keywords that indicate restaurant (NOT activity)
-    restaurant_only_keywords = ["dinner", "lunch"]
-    
-    # Keywords that indicate activity (even if at a restaurant-sounding venue)
-    activity_keywords = ["tasting", "tour", "tickets", "watching", "drive", "panorama", "route", "safari", 
-                         "cave", "elephant", "meerkat", "helicopter", "boat", "cruise", "island"]
+    restaurants = []
     
     for row in data_rows:
-        supplier = row.get("activity_supplier")
-        activity = row.get("activity_name")
-        
-        if not supplier:
-            continue
+        # Multi-line entries (already split per line)
+        activities = row.activity_names
+        times = row.activity_times
+        notes_list = row.activity_notes_lines
         
-        # Handle multi-line entries
-        suppliers = [s.strip() for s in supplier.split('\n') if s.strip()]
-        activities = [a.strip() for a in (activity or "").split('\n') if a.strip()]
-        times = [t.strip() for t in (row.get("activity_time") or "").split('\n') if t.strip()]
-        notes_list = [n.strip() for n in (row.get("activity_notes") or "").split('\n') if n.strip()]
-        
-        for idx, sup in enumerate(suppliers):
+        for idx, sup in enumerate(row.activity_suppliers):
             act = activities[idx] if idx < len(activities) else ""
             time = times[idx] if idx < len(times) else ""
             notes = notes_list[idx] if idx < len(notes_list) else ""
             
             # CRITICAL: Skip table reservations marked with (TR)
+            # These are just reservations, NOT prepaid services - no voucher needed
             if is_table_reservation(sup):
-                logger.debug(f"Skipping table reservation (no activity voucher): {sup}")
+                logger.debug(f"Skipping table reservation (no voucher): {sup}")
                 continue
             
             combined_text = (sup + " " + act + " " + notes).lower()
             
-            # Check if this is explicitly an activity (e.g., wine tasting)
-            is_explicit_activity = any(kw in combined_text for kw in activity_keywords)
-            
-            # Check if this is a restaurant meal
-            is_restaurant_meal = any(kw in combined_text for kw in restaurant_only_keywords)
-            
-            # If it's a restaurant meal and NOT an activity, skip (handle in parse_restaurants)
-            if is_restaurant_meal and not is_explicit_activity:
-                continue
+            if _MEAL_RE.search(combined_text):
+                # Restaurant meal - unless it's actually an activity (like wine tasting)
+                if not _MEAL_ACTIVITY_RE.search(combined_text):
+                    restaurants.append(RestaurantVoucher(
+                        supplier=sup,  # Keep supplier name EXACTLY as in ORGA
+                        date=row.date,
+                        time=time,
+                        notes=notes or act  # Include activity description as notes
+                    ))
+                
+                # A meal is only also an activity if explicitly marked as one
+                if not _ACTIVITY_RE.search(combined_text):
+                    continue
             
             # Check if this is a game drive at a safari lodge (should be part of hotel)
             if "game drive" in act.lower():
                 continue  # Will be included in hotel voucher
             
-            sup_key = sup.lower().strip()
+            sup_key = _norm_key(sup)
             
-            if sup_key not in activities_by_supplier:
-                info = get_supplier_info(sup)
-                activities_by_supplier[sup_key] = ActivityVoucher(
+            voucher = activities_by_supplier.get(sup_key)
+            if voucher is None:
+                info = get_supplier_info(sup_key)
+                voucher = ActivityVoucher(
                     supplier=sup,  # Keep supplier name EXACTLY as in ORGA
                     address=info.get("address", ""),
                     phone=info.get("phone", ""),
                     gps=info.get("gps", "")
                 )
+                activities_by_supplier[sup_key] = voucher
             
             entry = ActivityEntry(
-                date=row["date"],
+                date=row.date,
                 activity_name=act or sup,  # Use supplier name if no activity specified
                 time=time,
                 notes=notes
             )
-            activities_by_supplier[sup_key].entries.append(entry)
+            voucher.entries.append(entry)
     
-    return list(activities_by_supplier.values())
+    # Add supplier info
+    add_supplier_info(restaurants)
+    
+    return list(activities_by_supplier.values()), restaurants
 
 
 def is_table_reservation(supplier_name: str) -> bool:
@@ -843,7 +1116,6 @@ def is_table_reservation(supplier_name: str) -> bool:
         return True
     
     # Use regex for more complex patterns
-    import re
     # Match standalone TR (not TRF, TRANSFER, etc.)
     # Pattern: word boundary + TR + (end or space or punctuation)
     if re.search(r'\bTR\b(?!F|ANS)', name_upper):
@@ -853,73 +1125,7 @@ def is_table_reservation(supplier_name: str) -> bool:
     return False
 
 
-def parse_restaurants(data_rows: List[Dict]) -> List[RestaurantVoucher]:
-    """Parse restaurant vouchers from data rows.
-    
-    IMPORTANT: Skip entries marked with (TR) - these are table reservations only,
-    not prepaid services, so they don't need vouchers.
-    """
-    restaurants = []
-    
-    # Keywords for restaurant meals only
-    restaurant_keywords = ["dinner", "lunch"]
-    
-    # Keywords that indicate activity (NOT restaurant) even at dining venues
-    activity_keywords = ["tasting", "tour", "tickets", "watching"]
-    
-    for row in data_rows:
-        supplier = row.get("activity_supplier")
-        activity = row.get("activity_name")
-        
-        if not supplier:
-            continue
-        
-        # Handle multi-line entries
-        suppliers = [s.strip() for s in supplier.split('\n') if s.strip()]
-        activities = [a.strip() for a in (activity or "").split('\n') if a.strip()]
-        times = [t.strip() for t in (row.get("activity_time") or "").split('\n') if t.strip()]
-        notes_list = [n.strip() for n in (row.get("activity_notes") or "").split('\n') if n.strip()]
-        
-        for idx, sup in enumerate(suppliers):
-            act = activities[idx] if idx < len(activities) else ""
-            time = times[idx] if idx < len(times) else ""
-            notes = notes_list[idx] if idx < len(notes_list) else ""
-            
-            # CRITICAL: Skip table reservations marked with (TR)
-            # These are just reservations, NOT prepaid services - no voucher needed
-            if is_table_reservation(sup):
-                logger.debug(f"Skipping table reservation (no voucher): {sup}")
-                continue
-            
-            combined_text = (sup + " " + act + " " + notes).lower()
-            
-            # Check if this is a restaurant meal
-            is_restaurant_meal = any(kw in combined_text for kw in restaurant_keywords)
-            
-            # Check if this is actually an activity (like wine tasting)
-            is_activity = any(kw in combined_text for kw in activity_keywords)
-            
-            # Only include if it's a restaurant meal AND NOT an activity
-            if not is_restaurant_meal or is_activity:
-                continue
-            
-            info = get_supplier_info(sup)
-            
-            restaurant = RestaurantVoucher(
-                supplier=sup,  # Keep supplier name EXACTLY as in ORGA
-                date=row["date"],
-                time=time,
-                notes=notes or act,  # Include activity description as notes
-                address=info.get("address", ""),
-                phone=info.get("phone", ""),
-                gps=info.get("gps", "")
-            )
-            restaurants.append(restaurant)
-    
-    return restaurants
-
-
-def parse_golf(data_rows: List[Dict]) -> List[GolfVoucher]:
+def parse_golf(data_rows: List[DataRow]) -> List[GolfVoucher]:
     """Parse golf vouchers from data rows.
     
     Golf vouchers are generated when golf_supplier is present.
@@ -928,9 +1134,9 @@ def parse_golf(data_rows: List[Dict]) -> List[GolfVoucher]:
     golf_vouchers = []
     
     for row in data_rows:
-        supplier = row.get("golf_supplier")
-        course = row.get("golf_course")
-        tee_time = row.get("tee_time")
+        supplier = row.golf_supplier
+        course = row.golf_course
+        tee_time = row.tee_time
         
         # Need at least supplier OR course to generate a golf voucher
         if not supplier and not course:
@@ -943,30 +1149,28 @@ def parse_golf(data_rows: List[Dict]) -> List[GolfVoucher]:
             course = supplier
         
         # Handle multi-line entries (multiple tee times on same day)
-        suppliers = [s.strip() for s in str(supplier).split('\n') if s.strip()]
-        courses = [c.strip() for c in str(course).split('\n') if c.strip()]
-        tee_times = [t.strip() for t in str(tee_time or "").split('\n') if t.strip()]
+        suppliers = _split_lines(str(supplier))
+        courses = _split_lines(str(course))
+        tee_times = _split_lines(str(tee_time or ""))
         
         for idx, sup in enumerate(suppliers):
             crs = courses[idx] if idx < len(courses) else courses[0] if courses else sup
             tt = tee_times[idx] if idx < len(tee_times) else ""
             
-            info = get_supplier_info(sup)
-            
             golf = GolfVoucher(
                 supplier=sup,  # Keep supplier name EXACTLY as in ORGA
                 course=crs,
-                date=row["date"],
+                date=row.date,
                 tee_time=tt,
-                cart=row.get("golf_cart", "") or "",
-                rental_set=row.get("rental_set", "") or "",
-                notes=row.get("golf_notes", "") or "",
-                address=info.get("address", ""),
-                phone=info.get("phone", ""),
-                gps=info.get("gps", "")
+                cart=row.golf_cart or "",
+                rental_set=row.rental_set or "",
+                notes=row.golf_notes or ""
             )
             golf_vouchers.append(golf)
             logger.info(f"Parsed golf: {sup} - {crs} @ {tt}")
     
+    # Add supplier info
+    add_supplier_info(golf_vouchers)
+    
     return golf_vouchers
 
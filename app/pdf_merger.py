@@ -9,14 +9,17 @@ Supports multiple conversion methods:
 """
 import logging
 import os
+import shutil
 import subprocess
 import platform
 import tempfile
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Tuple
 from datetime import date
 from pathlib import Path
 
-from PyPDF2 import PdfMerger, PdfReader
+from PyPDF2 import PdfReader, PdfWriter
 
 logger = logging.getLogger(__name__)
 
@@ -24,21 +27,29 @@ logger = logging.getLogger(__name__)
 _conversion_method = None
 
 
+@lru_cache(maxsize=1)
 def check_docx2pdf_available() -> bool:
-    """Check if docx2pdf (Microsoft Word) is available."""
+    """Check if docx2pdf (Microsoft Word) is available (checked once per process)."""
+    # Word automation only exists on Windows - don't even try the imports elsewhere
+    if platform.system() != "Windows":
+        return False
     try:
         import docx2pdf
-        # On Windows, check if Word is installed by trying to import win32com
-        if platform.system() == "Windows":
-            import win32com.client
-            return True
+        # Check if Word is installed by trying to import win32com
+        import win32com.client
+        return True
     except ImportError:
         pass
     return False
 
 
+@lru_cache(maxsize=1)
 def find_libreoffice() -> str:
-    """Find LibreOffice installation path."""
+    """Find LibreOffice installation path.
+    
+    Cached: every conversion asks for the path, but the stat() calls and the
+    which/where lookup only run once per process.
+    """
     system = platform.system()
     
     if system == "Windows":
@@ -62,19 +73,8 @@ def find_libreoffice() -> str:
         if os.path.exists(path):
             return path
     
-    # Try to find in PATH
-    try:
-        result = subprocess.run(
-            ["which", "libreoffice"] if system != "Windows" else ["where", "libreoffice"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip().split('\n')[0]
-    except Exception:
-        pass
-    
-    return None
+    # Try to find in PATH (in-process, no which/where subprocess)
+    return shutil.which("libreoffice") or shutil.which("soffice")
 
 
 def get_conversion_method() -> str:
@@ -123,6 +123,102 @@ def convert_docx_to_pdf_with_word(docx_path: str, output_dir: str) -> str:
     return pdf_path
 
 
+def convert_docx_parallel_with_libreoffice(docx_paths: List[str], output_dir: str) -> List[str]:
+    """Convert Word documents to PDF with several LibreOffice processes.
+    
+    The documents are split across up to 4 workers (bounded by CPU count);
+    each worker converts its share in one batched soffice run.
+    
+    Args:
+        docx_paths: Paths of the Word documents to convert
+        output_dir: Directory to store PDF files
+        
+    Returns:
+        PDF paths in the same order as docx_paths
+    """
+    workers = min(4, os.cpu_count() or 1, len(docx_paths))
+    if workers <= 1:
+        return convert_docx_batch_with_libreoffice(docx_paths, output_dir)
+    
+    # Worker k converts every k-th document, always with profile k
+    chunks = [docx_paths[k::workers] for k in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            convert_docx_batch_with_libreoffice,
+            chunks,
+            [output_dir] * workers,
+            range(workers)
+        ))
+    
+    # Restore the input order
+    pdf_paths = [None] * len(docx_paths)
+    for k, chunk_pdf_paths in enumerate(results):
+        pdf_paths[k::workers] = chunk_pdf_paths
+    return pdf_paths
+
+
+def _convert_one_with_word(args: Tuple[str, str]) -> str:
+    """Convert one document in its own Word instance (runs in a worker process).
+    
+    Args:
+        args: (docx_path, output_dir) tuple
+    """
+    import pythoncom
+    import win32com.client
+    
+    docx_path, output_dir = args
+    docx_filename = os.path.basename(docx_path)
+    pdf_filename = os.path.splitext(docx_filename)[0] + ".pdf"
+    pdf_path = os.path.join(output_dir, pdf_filename)
+    
+    pythoncom.CoInitialize()
+    try:
+        # DispatchEx starts a separate Word process instead of sharing one
+        word = win32com.client.DispatchEx("Word.Application")
+        try:
+            doc = word.Documents.Open(os.path.abspath(docx_path), ReadOnly=True)
+            try:
+                doc.ExportAsFixedFormat(os.path.abspath(pdf_path), 17)  # 17 = wdExportFormatPDF
+            finally:
+                doc.Close(0)  # 0 = wdDoNotSaveChanges
+        finally:
+            word.Quit()
+    finally:
+        pythoncom.CoUninitialize()
+    
+    if not os.path.exists(pdf_path):
+        raise RuntimeError(f"PDF file was not created: {pdf_path}")
+    
+    return pdf_path
+
+
+def convert_docx_batch_with_word(docx_paths: List[str], output_dir: str) -> List[str]:
+    """Convert several Word documents to PDF with parallel Word instances.
+    
+    A single Word instance converts one document at a time, so up to 4
+    worker processes each drive their own instance.
+    
+    Args:
+        docx_paths: Paths of the Word documents to convert
+        output_dir: Directory to store PDF files
+        
+    Returns:
+        PDF paths in the same order as docx_paths
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    
+    logger.info(f"Converting {len(docx_paths)} documents to PDF (Word, parallel)")
+    
+    jobs = [(docx_path, output_dir) for docx_path in docx_paths]
+    try:
+        # Collected here, so the pool and its Word processes are always
+        # shut down before returning - even if the caller stops early
+        with ProcessPoolExecutor(max_workers=min(4, len(jobs))) as executor:
+            return list(executor.map(_convert_one_with_word, jobs))
+    except Exception as e:
+        raise RuntimeError(f"PDF conversion with Word failed: {str(e)}")
+
+
 def convert_docx_to_pdf_with_libreoffice(docx_path: str, output_dir: str) -> str:
     """Convert Word document to PDF using LibreOffice."""
     libreoffice_path = find_libreoffice()
@@ -167,6 +263,85 @@ def convert_docx_to_pdf_with_libreoffice(docx_path: str, output_dir: str) -> str
     return pdf_path
 
 
+def convert_docx_batch_with_libreoffice(
+    docx_paths: List[str],
+    output_dir: str,
+    worker_id: Optional[int] = None
+) -> List[str]:
+    """Convert several Word documents to PDF in a single LibreOffice run.
+    
+    LibreOffice startup dominates the time of a single conversion, so all
+    files are passed to one soffice invocation.
+    
+    Args:
+        docx_paths: Paths of the Word documents to convert
+        output_dir: Directory to store PDF files
+        worker_id: Use a private, temporary LibreOffice user profile for
+            this worker, so several soffice processes can run at the same time
+        
+    Returns:
+        PDF paths in the same order as docx_paths
+    """
+    libreoffice_path = find_libreoffice()
+    
+    if not libreoffice_path:
+        raise RuntimeError("LibreOffice not found")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    cmd = [
+        libreoffice_path,
+        "--headless",
+        "--convert-to", "pdf",
+        "--outdir", output_dir,
+    ] + list(docx_paths)
+    
+    profile_dir = None
+    if worker_id is not None:
+        # LibreOffice refuses to start twice on the same profile - a fresh
+        # directory per call also keeps concurrent requests apart
+        profile_dir = tempfile.mkdtemp(prefix=f"lo_profile_{worker_id}_")
+        cmd.insert(1, f"-env:UserInstallation={Path(profile_dir).as_uri()}")
+    
+    logger.info(f"Converting {len(docx_paths)} documents to PDF (LibreOffice batch)")
+    
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            # Never less than the single-file timeout - a cold start alone can take a while
+            timeout=max(60, 30 + 5 * len(docx_paths))
+        )
+        
+        if result.returncode != 0:
+            logger.error(f"LibreOffice error: {result.stderr}")
+            raise RuntimeError(f"PDF conversion failed: {result.stderr}")
+        
+    except subprocess.TimeoutExpired:
+        raise RuntimeError("PDF conversion timed out")
+    finally:
+        if profile_dir is not None:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+    
+    # One directory listing instead of an exists() check per file
+    with os.scandir(output_dir) as entries:
+        produced = {entry.name for entry in entries if entry.name.endswith(".pdf")}
+    
+    pdf_paths = []
+    for docx_path in docx_paths:
+        docx_filename = os.path.basename(docx_path)
+        pdf_filename = os.path.splitext(docx_filename)[0] + ".pdf"
+        pdf_path = os.path.join(output_dir, pdf_filename)
+        
+        if pdf_filename not in produced:
+            raise RuntimeError(f"PDF file was not created: {pdf_path}")
+        
+        pdf_paths.append(pdf_path)
+    
+    return pdf_paths
+
+
 def convert_docx_to_pdf(docx_path: str, output_dir: str) -> str:
     """Convert a Word document to PDF.
     
@@ -203,17 +378,63 @@ def convert_all_to_pdf(
     Returns:
         List of (pdf_path, voucher_type, date) tuples
     """
-    pdf_vouchers = []
+    docx_paths = [docx_path for docx_path, _, _ in vouchers]
+    pdf_paths = list(iter_convert_to_pdf(docx_paths, output_dir))
+    
+    return [
+        (pdf_path, voucher_type, voucher_date)
+        for pdf_path, (_, voucher_type, voucher_date) in zip(pdf_paths, vouchers)
+    ]
+
+
+def iter_convert_to_pdf(docx_paths: List[str], output_dir: str) -> Iterator[str]:
+    """Convert Word documents to PDF, yielding the PDF paths in input order.
     
-    for docx_path, voucher_type, voucher_date in vouchers:
+    Single-file conversions are yielded one by one as they finish, so the
+    caller can already process the first PDFs while the rest are
+    converting. Batched conversions (parallel Word, LibreOffice) arrive
+    together.
+    
+    Args:
+        docx_paths: Paths of the Word documents to convert
+        output_dir: Directory to store PDF files
+    """
+    method = get_conversion_method() if docx_paths else "none"
+    
+    if method == "libreoffice" or (method == "docx2pdf" and len(docx_paths) > 1):
         try:
-            pdf_path = convert_docx_to_pdf(docx_path, output_dir)
-            pdf_vouchers.append((pdf_path, voucher_type, voucher_date))
+            if method == "libreoffice":
+                # A few batched LibreOffice runs instead of one start-up per file
+                yield from convert_docx_parallel_with_libreoffice(docx_paths, output_dir)
+            else:
+                yield from convert_docx_batch_with_word(docx_paths, output_dir)
         except Exception as e:
-            logger.error(f"Failed to convert {docx_path}: {e}")
+            logger.error(f"Failed to convert {len(docx_paths)} documents: {e}")
             raise
+        return
     
-    return pdf_vouchers
+    for docx_path in docx_paths:
+        try:
+            yield convert_docx_to_pdf(docx_path, output_dir)
+        except Exception as e:
+            logger.error(f"Failed to convert {docx_path}: {e}")
+            raise
+
+
+# Voucher type order in the final document (unknown types go last)
+VOUCHER_TYPE_PRIORITY = {
+    "hotel": 1,
+    "transfer": 2,
+    "car_rental": 3,
+    "activity": 4,
+    "restaurant": 5,
+    "golf": 6,
+}
+
+
+def _voucher_sort_key(voucher: Tuple[str, str, date]) -> Tuple[int, date]:
+    """Sort key for a (path, voucher_type, date) tuple: type priority, then date."""
+    return VOUCHER_TYPE_PRIORITY.get(voucher[1], 99), voucher[2]
 
 
 def sort_vouchers(vouchers: List[Tuple[str, str, date]]) -> List[Tuple[str, str, date]]:
@@ -221,51 +442,49 @@ def sort_vouchers(vouchers: List[Tuple[str, str, date]]) -> List[Tuple[str, str,
     
     Order: Hotels, Transfers, Car Rental, Activities, Restaurants, Golf
     """
-    type_priority = {
-        "hotel": 1,
-        "transfer": 2,
-        "car_rental": 3,
-        "activity": 4,
-        "restaurant": 5,
-        "golf": 6,
-    }
-    
-    return sorted(vouchers, key=lambda v: (type_priority.get(v[1], 99), v[2]))
+    return sorted(vouchers, key=_voucher_sort_key)
 
 
 def merge_pdfs(
-    pdf_files: List[str],
+    pdf_files: Iterable[str],
     output_path: str
 ) -> str:
     """Merge multiple PDF files into a single PDF.
     
     Args:
-        pdf_files: List of paths to PDF files
+        pdf_files: Paths to PDF files, in merge order. May be a generator
+            (e.g. iter_convert_to_pdf) - each file is appended as soon as
+            it is produced.
         output_path: Path for the merged output PDF
         
     Returns:
         Path to the merged PDF file
     """
-    logger.info(f"Merging {len(pdf_files)} PDFs into {output_path}")
+    logger.info(f"Merging PDFs into {output_path}")
     
-    merger = PdfMerger()
+    # Each input is parsed once and its pages appended directly; PdfMerger
+    # also tracks outlines/named destinations we don't use
+    writer = PdfWriter()
+    merged_count = 0
     
     for pdf_file in pdf_files:
         if os.path.exists(pdf_file):
-            merger.append(pdf_file)
+            writer.append_pages_from_reader(PdfReader(pdf_file, strict=False))
+            merged_count += 1
         else:
             logger.warning(f"PDF file not found, skipping: {pdf_file}")
     
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    merger.write(output_path)
-    merger.close()
+    with open(output_path, "wb") as f:
+        writer.write(f)
+    writer.close()
     
     if not os.path.exists(output_path):
         raise RuntimeError(f"Failed to create merged PDF: {output_path}")
     
-    logger.info(f"Successfully created merged PDF: {output_path}")
+    logger.info(f"Successfully created merged PDF from {merged_count} files: {output_path}")
     return output_path
 
 
@@ -274,7 +493,10 @@ def process_vouchers_to_pdf(
     output_dir: str,
     final_pdf_name: str = "Travel_Vouchers.pdf"
 ) -> str:
-    """Process all vouchers: convert to PDF, sort, and merge.
+    """Process all vouchers: sort, convert to PDF, and merge.
+    
+    Vouchers are sorted before conversion, so each converted PDF can be
+    appended to the merged document while later ones are still converting.
     
     Args:
         vouchers: List of (docx_path, voucher_type, date) tuples
@@ -291,19 +513,14 @@ def process_vouchers_to_pdf(
     pdf_dir = os.path.join(output_dir, "pdfs")
     os.makedirs(pdf_dir, exist_ok=True)
     
-    # Convert all to PDF
-    logger.info(f"Converting {len(vouchers)} vouchers to PDF...")
-    pdf_vouchers = convert_all_to_pdf(vouchers, pdf_dir)
-    
     # Sort by type and date
-    sorted_vouchers = sort_vouchers(pdf_vouchers)
-    
-    # Get just the PDF paths in sorted order
-    sorted_pdf_paths = [v[0] for v in sorted_vouchers]
+    sorted_vouchers = sort_vouchers(vouchers)
     
-    # Merge into final PDF
+    # Convert to PDF and merge into the final PDF as the conversions finish
+    logger.info(f"Converting {len(vouchers)} vouchers to PDF...")
+    docx_paths = [v[0] for v in sorted_vouchers]
     final_path = os.path.join(output_dir, final_pdf_name)
-    merge_pdfs(sorted_pdf_paths, final_path)
+    merge_pdfs(iter_convert_to_pdf(docx_paths, pdf_dir), final_path)
     
     return final_path
 
@@ -327,7 +544,6 @@ def process_vouchers_to_zip(
         Path to the final ZIP file
     """
     import zipfile
-    import shutil
     
     if not vouchers:
         raise ValueError("No vouchers to process")
@@ -349,7 +565,8 @@ def process_vouchers_to_zip(
                 original_name = os.path.basename(docx_path)
                 # Add index prefix to maintain sort order
                 new_name = f"{idx:02d}_{original_name}"
-                zf.write(docx_path, new_name)
+                # A .docx is already a deflated zip - store it as-is
+                zf.write(docx_path, new_name, compress_type=zipfile.ZIP_STORED)
                 logger.info(f"Added to ZIP: {new_name}")
             else:
                 logger.warning(f"DOCX file not found, skipping: {docx_path}")
@@ -377,7 +594,6 @@ def merge_docx_files(
     from docx import Document
     from docx.oxml.ns import qn
     from docx.oxml import OxmlElement
-    from copy import deepcopy
     
     if not vouchers:
         raise ValueError("No vouchers to merge")
@@ -413,30 +629,29 @@ def merge_docx_files(
         # Open the document to append
         sub_doc = Document(docx_path)
         
-        # Get content elements (tables and non-empty paragraphs only)
+        # Get content elements (tables and non-empty paragraphs only).
+        # They are moved, not copied - sub_doc is discarded afterwards.
         content_elements = []
         for element in sub_doc.element.body:
             tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
             if tag == 'tbl':
-                content_elements.append(deepcopy(element))
+                content_elements.append(element)
             elif tag == 'p':
                 # Skip empty paragraphs and paragraphs with only page breaks
                 text = ''.join(element.itertext()).strip()
                 has_only_break = _has_only_page_break(element)
                 if text and not has_only_break:
-                    content_elements.append(deepcopy(element))
+                    content_elements.append(element)
         
         # Skip if no real content
         if not content_elements:
             continue
         
-        # Add page break paragraph before this voucher's content
+        # Add page break paragraph before this voucher's content, then
+        # splice in all content elements in one call
         page_break_p = _create_page_break_paragraph()
         body.append(page_break_p)
-        
-        # Append content elements
-        for element in content_elements:
-            body.append(element)
+        body.extend(content_elements)
     
     # Re-add section properties at the end
     if sect_pr is not None:
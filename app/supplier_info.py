@@ -11,19 +11,50 @@ Your team can edit suppliers.yaml directly - no coding required!
 """
 import logging
 import os
+import re
+from bisect import bisect_right
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional
 import yaml
 
 logger = logging.getLogger(__name__)
 
-# Cache for loaded suppliers
-_suppliers_cache: Dict[str, dict] = {}
+# Table reservation marker at the end of a name: "Name (TR)" or "Name TR"
+# or both, "Name TR (TR)"
+_TR_SUFFIX_RE = re.compile(r'(?:\s+TR)?\s*\(TR\)\s*$|\s+TR\s*$', re.IGNORECASE)
+
+# Cache for loaded suppliers (read-only views, handed out as-is by lookups)
+_suppliers_cache: Dict[str, Mapping[str, str]] = {}
 _last_load_time: float = 0
+_config_path: Optional[Path] = None
+
+_KEY_PREFIX_LEN = 3
+_KEY_SEPARATOR = "\0"
+
+
+class _KeyIndex(NamedTuple):
+    """Supplier entries plus the indexes for the partial and first-word match."""
+    entries: Dict[str, Mapping[str, str]]  # the cache this index was built from
+    keys: List[str]                        # keys in file order
+    by_prefix: Dict[str, List[int]]        # first 3 chars -> key positions
+    short_keys: List[int]                  # positions of keys shorter than 3 chars
+    text: str                              # all keys joined by _KEY_SEPARATOR
+    offsets: List[int]                     # start of each key in text
+    by_first_word: Dict[str, str]          # first word -> first key starting with it
+
+
+# Replaced as a whole on reload, so a lookup never mixes old and new parts
+_key_index: Optional[_KeyIndex] = None
 
 
 def _get_config_path() -> Path:
-    """Get path to suppliers.yaml config file."""
+    """Get path to suppliers.yaml config file (remembered once found)."""
+    global _config_path
+    
+    if _config_path is not None:
+        return _config_path
+    
     possible_paths = [
         Path(__file__).parent.parent / "config" / "suppliers.yaml",
         Path("config/suppliers.yaml"),
@@ -32,65 +63,136 @@ def _get_config_path() -> Path:
     
     for path in possible_paths:
         if path.exists():
+            _config_path = path
             return path
     
     return possible_paths[0]
 
 
+def _build_key_index(entries: Dict[str, Mapping[str, str]]) -> _KeyIndex:
+    """Index the supplier keys for _find_partial_match and the first-word match."""
+    keys = list(entries)
+    by_prefix: Dict[str, List[int]] = {}
+    short_keys: List[int] = []
+    offsets: List[int] = []
+    by_first_word: Dict[str, str] = {}
+    offset = 0
+    for idx, key in enumerate(keys):
+        key_words = key.split()
+        if key_words:
+            by_first_word.setdefault(key_words[0], key)
+        if len(key) < _KEY_PREFIX_LEN:
+            short_keys.append(idx)
+        else:
+            by_prefix.setdefault(key[:_KEY_PREFIX_LEN], []).append(idx)
+        offsets.append(offset)
+        offset += len(key) + len(_KEY_SEPARATOR)
+    return _KeyIndex(entries, keys, by_prefix, short_keys,
+                     _KEY_SEPARATOR.join(keys), offsets, by_first_word)
+
+
+def _find_partial_match(index: _KeyIndex, name_upper: str) -> Optional[str]:
+    """Find the first key (in file order) contained in the name or containing it.
+    
+    Same result as testing every key, without the per-key Python loop:
+    - "name in key" is a single find() over all keys joined together
+    - "key in name" is only tested for keys whose first 3 characters
+      occur somewhere in the name
+    """
+    keys = index.keys
+    if _KEY_SEPARATOR in name_upper:
+        for key in keys:
+            if key in name_upper or name_upper in key:
+                return key
+        return None
+    
+    best = None
+    
+    pos = index.text.find(name_upper)
+    # An empty name "finds" position 0 even when there are no keys at all
+    if pos >= 0 and keys:
+        best = bisect_right(index.offsets, pos) - 1
+    
+    candidates = list(index.short_keys)
+    for start in range(len(name_upper) - _KEY_PREFIX_LEN + 1):
+        candidates.extend(index.by_prefix.get(name_upper[start:start + _KEY_PREFIX_LEN], ()))
+    for idx in candidates:
+        if (best is None or idx < best) and keys[idx] in name_upper:
+            best = idx
+    
+    return keys[best] if best is not None else None
+
+
+def _read_suppliers(config_path: Path) -> Dict[str, Mapping[str, str]]:
+    """Read all suppliers from the YAML config into a flat dictionary.
+    
+    Keys are normalized to uppercase for case-insensitive lookup.
+    """
+    suppliers: Dict[str, Mapping[str, str]] = {}
+    
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    
+    if not config:
+        return suppliers
+    
+    # Load all categories into a flat dictionary
+    for category_name, category_suppliers in config.items():
+        if not isinstance(category_suppliers, dict):
+            continue
+        
+        for orga_name, info in category_suppliers.items():
+            if not isinstance(info, dict):
+                continue
+            
+            # Normalize key to uppercase
+            key = orga_name.upper().strip()
+            
+            suppliers[key] = MappingProxyType({
+                "display_name": info.get("name", orga_name),
+                "address": info.get("address", "") or "",
+                "phone": info.get("phone", "") or "",
+                "gps": info.get("gps", "") or "",
+                "category": category_name
+            })
+    
+    return suppliers
+
+
 def _load_suppliers() -> None:
     """Load all suppliers from YAML config file."""
-    global _suppliers_cache, _last_load_time
+    global _suppliers_cache, _key_index, _last_load_time, _config_path
     
     config_path = _get_config_path()
     
-    # Check if file was modified since last load
-    if config_path.exists():
-        mtime = config_path.stat().st_mtime
+    # Check if file was modified since last load (one stat() per call)
+    try:
+        mtime = os.stat(config_path).st_mtime
+    except FileNotFoundError:
+        mtime = None
+        _config_path = None  # Look for it again next time
+    
+    if mtime is not None:
         if mtime <= _last_load_time and _suppliers_cache:
             return  # Already loaded and up-to-date
         _last_load_time = mtime
     
-    _suppliers_cache = {}
-    
-    if not config_path.exists():
+    suppliers: Dict[str, Mapping[str, str]] = {}
+    if mtime is None:
         logger.warning(f"Suppliers config not found: {config_path}")
-        return
+    else:
+        try:
+            suppliers = _read_suppliers(config_path)
+            logger.info(f"Loaded {len(suppliers)} suppliers from {config_path}")
+        except Exception as e:
+            logger.error(f"Error loading suppliers: {e}")
     
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-        
-        if not config:
-            return
-        
-        # Load all categories into a flat dictionary
-        # Keys are normalized to uppercase for case-insensitive lookup
-        for category_name, suppliers in config.items():
-            if not isinstance(suppliers, dict):
-                continue
-            
-            for orga_name, info in suppliers.items():
-                if not isinstance(info, dict):
-                    continue
-                
-                # Normalize key to uppercase
-                key = orga_name.upper().strip()
-                
-                _suppliers_cache[key] = {
-                    "display_name": info.get("name", orga_name),
-                    "address": info.get("address", "") or "",
-                    "phone": info.get("phone", "") or "",
-                    "gps": info.get("gps", "") or "",
-                    "category": category_name
-                }
-        
-        logger.info(f"Loaded {len(_suppliers_cache)} suppliers from {config_path}")
-        
-    except Exception as e:
-        logger.error(f"Error loading suppliers: {e}")
+    # Publish the finished cache and its index together
+    _key_index = _build_key_index(suppliers)
+    _suppliers_cache = suppliers
 
 
-def get_supplier_info(supplier_name: str, category: str = None) -> dict:
+def get_supplier_info(supplier_name: str, category: str = None) -> Mapping[str, str]:
     """Look up supplier information by name (case-insensitive).
     
     Args:
@@ -98,7 +200,9 @@ def get_supplier_info(supplier_name: str, category: str = None) -> dict:
         category: Optional category hint (not used, kept for compatibility)
     
     Returns:
-        dict with 'display_name', 'address', 'phone', 'gps'
+        Mapping with 'display_name', 'address', 'phone', 'gps'. Known
+        suppliers get the shared read-only cache entry - use dict(info)
+        for a copy that can be modified.
     """
     if not supplier_name:
         return {}
@@ -110,28 +214,27 @@ def get_supplier_info(supplier_name: str, category: str = None) -> dict:
     name_upper = supplier_name.upper().strip()
     
     # Remove (TR) suffix if present
-    import re
-    name_upper = re.sub(r'\s*\(TR\)\s*$', '', name_upper, flags=re.IGNORECASE)
-    name_upper = re.sub(r'\s+TR\s*$', '', name_upper, flags=re.IGNORECASE)
-    name_upper = name_upper.strip()
+    name_upper = _TR_SUFFIX_RE.sub('', name_upper).strip()
+    
+    # One consistent snapshot, even if another thread reloads meanwhile
+    index = _key_index
+    entries = index.entries
     
     # Try exact match first
-    if name_upper in _suppliers_cache:
-        return _suppliers_cache[name_upper].copy()
+    if name_upper in entries:
+        return entries[name_upper]
     
     # Try partial match - look for key in name or name in key
-    for key, info in _suppliers_cache.items():
-        if key in name_upper or name_upper in key:
-            return info.copy()
+    key = _find_partial_match(index, name_upper)
+    if key is not None:
+        return entries[key]
     
     # Try matching first significant word
     words = name_upper.split()
     if words:
-        first_word = words[0]
-        for key, info in _suppliers_cache.items():
-            key_words = key.split()
-            if key_words and first_word == key_words[0]:
-                return info.copy()
+        key = index.by_first_word.get(words[0])
+        if key is not None:
+            return entries[key]
     
     # Return default with formatted name
     return {
@@ -11,17 +11,34 @@ If validation fails, a debug report is generated.
 import json
 import logging
 import os
+import sys
+from collections import defaultdict
 from datetime import date, datetime
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+from dataclasses import dataclass
+
+try:
+    import orjson  # Optional, much faster JSON encoder
+except ImportError:
+    orjson = None
 
 from .models import ParsedORGA
 from .name_mapper import get_suspicious_names_log, clear_suspicious_names_log
 
 logger = logging.getLogger(__name__)
 
+_LEG_DATE = attrgetter('date')
+
+# Cap on recorded errors - a malformed ORGA can otherwise produce thousands
+_MAX_ERRORS = 50
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationItem:
     """Represents an item being validated."""
     type: str  # 'hotel', 'golf', 'activity', 'restaurant', 'transfer', 'car_rental'
@@ -30,9 +47,21 @@ class ValidationItem:
     voucher_generated: bool
     skipped_reason: Optional[str] = None
     canonical_name: Optional[str] = None
+    suspicious_title: bool = False  # Set at creation, see _is_suspicious_title
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for the JSON report (asdict() deep-copies every field)."""
+        return {
+            'type': self.type,
+            'orga_name': self.orga_name,
+            'orga_date': self.orga_date,
+            'voucher_generated': self.voucher_generated,
+            'skipped_reason': self.skipped_reason,
+            'canonical_name': self.canonical_name,
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationReport:
     """Complete validation report for a voucher generation run."""
     timestamp: str
@@ -60,15 +89,92 @@ class ValidationReport:
     # Status
     passed: bool
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for the JSON report.
+        
+        The item lists are shared, not copied - the dict is only used to
+        serialize the report.
+        """
+        return {
+            'timestamp': self.timestamp,
+            'orga_file': self.orga_file,
+            'region': self.region,
+            'total_orga_items': self.total_orga_items,
+            'vouchers_generated': self.vouchers_generated,
+            'items_skipped': self.items_skipped,
+            'hotels': self.hotels,
+            'golf': self.golf,
+            'activities': self.activities,
+            'restaurants': self.restaurants,
+            'transfers': self.transfers,
+            'car_rentals': self.car_rentals,
+            'suspicious_names': self.suspicious_names,
+            'empty_titles': self.empty_titles,
+            'validation_errors': self.validation_errors,
+            'passed': self.passed,
+        }
+
+
+def _is_suspicious_title(name: Optional[str]) -> bool:
+    """Check if a voucher title is empty or too short (under 3 characters)."""
+    if not name or len(name) < 3:
+        return True
+    # Only strip (which copies the string) when there is surrounding whitespace
+    if name[0].isspace() or name[-1].isspace():
+        return len(name.strip()) < 3
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _date_str(value: Optional[date]) -> str:
+    """str() of a voucher date, cached - a trip repeats the same few dates.
+    
+    Plain dates use isoformat() directly (same text as str()); anything
+    else, including None, keeps its str() form as before.
+    """
+    if type(value) is date:
+        return value.isoformat()
+    return str(value)
+
+
+def _first_entry_date(activity) -> Optional[str]:
+    """Date of the activity's first entry, if any."""
+    return _date_str(activity.entries[0].date) if activity.entries else None
+
+
+def _earliest_leg_date(transfer) -> Optional[str]:
+    """Date of the transfer's earliest leg, if any."""
+    earliest = min(transfer.legs, key=_LEG_DATE).date if transfer.legs else None
+    return _date_str(earliest) if earliest else None
+
 
 class VoucherValidator:
     """Validates voucher generation before producing final PDFs."""
     
+    # (item type, ParsedORGA attribute, date getter, canonical name getter,
+    #  skip reason outside SA - None if always generated)
+    # Hotels, golf and transfers are always generated; activities,
+    # restaurants (already filtered for TR in parser) and car rentals are SA only.
+    _SPECS = (
+        ('hotel', 'hotels', lambda h: _date_str(h.check_in), lambda h: h.supplier, None),
+        ('golf', 'golf', lambda g: _date_str(g.date), lambda g: g.course, None),
+        ('activity', 'activities', _first_entry_date, lambda a: a.supplier,
+         "EU region - no activity vouchers"),
+        ('restaurant', 'restaurants', lambda r: _date_str(r.date), lambda r: r.supplier,
+         "EU region - no restaurant vouchers"),
+        ('transfer', 'transfers', _earliest_leg_date, lambda t: t.supplier, None),
+        ('car_rental', 'car_rentals', lambda c: _date_str(c.pickup_date), lambda c: c.supplier,
+         "EU region - no car rental vouchers"),
+    )
+    
     def __init__(self, parsed_data: ParsedORGA, orga_file: str = ""):
         self.parsed_data = parsed_data
         self.orga_file = orga_file
         self.items: List[ValidationItem] = []
+        # The same items grouped by type, filled as they are created
+        self._by_type: Dict[str, List[ValidationItem]] = defaultdict(list)
         self.errors: List[str] = []
+        self._suppressed = 0  # Errors beyond _MAX_ERRORS, only counted
         
     def validate(self) -> Tuple[bool, ValidationReport]:
         """Run all validations and return (passed, report).
@@ -76,115 +182,73 @@ class VoucherValidator:
         Returns:
             Tuple of (passed: bool, report: ValidationReport)
         """
+        self.validate_fast()
+        
+        # Build report
+        report = self._build_report()
+        
+        return report.passed, report
+    
+    def validate_fast(self) -> bool:
+        """Run all validations without building the report.
+        
+        Returns:
+            True if validation passed; call _build_report() afterwards if
+            the full report is needed
+        """
         clear_suspicious_names_log()
         self.items = []
+        self._by_type = defaultdict(list)
         self.errors = []
+        self._suppressed = 0
         
         # Validate each category
-        self._validate_hotels()
-        self._validate_golf()
-        self._validate_activities()
-        self._validate_restaurants()
-        self._validate_transfers()
-        self._validate_car_rentals()
+        self._validate_all()
         
         # Check for critical issues
         self._check_golf_generation()
         self._check_empty_titles()
+        if self._suppressed:
+            self.errors.append(f"... and {self._suppressed} more errors suppressed")
         
-        # Build report
-        report = self._build_report()
-        
-        return report.passed, report
-    
-    def _validate_hotels(self) -> None:
-        """Validate hotel vouchers."""
-        for hotel in self.parsed_data.hotels:
-            item = ValidationItem(
-                type='hotel',
-                orga_name=hotel.supplier,
-                orga_date=str(hotel.check_in),
-                voucher_generated=True,  # Hotels are always generated
-                canonical_name=hotel.supplier
-            )
-            self.items.append(item)
-    
-    def _validate_golf(self) -> None:
-        """Validate golf vouchers."""
-        for golf in self.parsed_data.golf:
-            item = ValidationItem(
-                type='golf',
-                orga_name=golf.supplier,
-                orga_date=str(golf.date),
-                voucher_generated=True,
-                canonical_name=golf.course
-            )
-            self.items.append(item)
-    
-    def _validate_activities(self) -> None:
-        """Validate activity vouchers (SA region only)."""
-        region = self.parsed_data.region
-        
-        for activity in self.parsed_data.activities:
-            generated = region == "SA"
-            item = ValidationItem(
-                type='activity',
-                orga_name=activity.supplier,
-                orga_date=str(activity.entries[0].date) if activity.entries else None,
-                voucher_generated=generated,
-                skipped_reason="EU region - no activity vouchers" if not generated else None,
-                canonical_name=activity.supplier
+        # Log suspicious names as warnings but don't fail - one record for all
+        suspicious = get_suspicious_names_log()
+        if suspicious and logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Suspicious names without alias:\n"
+                + "\n".join(f"  '{name}' ({category})" for name, category in suspicious)
             )
-            self.items.append(item)
-    
-    def _validate_restaurants(self) -> None:
-        """Validate restaurant vouchers (SA region only, no TR)."""
-        region = self.parsed_data.region
         
-        for restaurant in self.parsed_data.restaurants:
-            generated = region == "SA"  # Already filtered for TR in parser
-            item = ValidationItem(
-                type='restaurant',
-                orga_name=restaurant.supplier,
-                orga_date=str(restaurant.date),
-                voucher_generated=generated,
-                skipped_reason="EU region - no restaurant vouchers" if not generated else None,
-                canonical_name=restaurant.supplier
-            )
-            self.items.append(item)
+        return len(self.errors) == 0
     
-    def _validate_transfers(self) -> None:
-        """Validate transfer vouchers."""
-        for transfer in self.parsed_data.transfers:
-            earliest = min(leg.date for leg in transfer.legs) if transfer.legs else None
-            item = ValidationItem(
-                type='transfer',
-                orga_name=transfer.supplier,
-                orga_date=str(earliest) if earliest else None,
-                voucher_generated=True,
-                canonical_name=transfer.supplier
-            )
-            self.items.append(item)
-    
-    def _validate_car_rentals(self) -> None:
-        """Validate car rental vouchers (SA region only)."""
-        region = self.parsed_data.region
+    def _validate_all(self) -> None:
+        """Create a ValidationItem for every parsed voucher, category by category."""
+        is_sa = self.parsed_data.region == "SA"
         
-        for car in self.parsed_data.car_rentals:
-            generated = region == "SA"
-            item = ValidationItem(
-                type='car_rental',
-                orga_name=car.supplier,
-                orga_date=str(car.pickup_date),
-                voucher_generated=generated,
-                skipped_reason="EU region - no car rental vouchers" if not generated else None,
-                canonical_name=car.supplier
-            )
-            self.items.append(item)
+        for item_type, attr, get_date, get_canonical, skipped_reason in self._SPECS:
+            # Region-gated categories are only generated for SA trips
+            generated = skipped_reason is None or is_sa
+            reason = None if generated else skipped_reason
+            bucket = self._by_type[item_type]
+            for voucher in getattr(self.parsed_data, attr):
+                canonical_name = get_canonical(voucher)
+                # Positional args in field order (type, orga_name, orga_date,
+                # voucher_generated, skipped_reason, canonical_name, suspicious_title)
+                item = ValidationItem(
+                    item_type,
+                    voucher.supplier,
+                    get_date(voucher),
+                    generated,
+                    reason,
+                    canonical_name,
+                    _is_suspicious_title(canonical_name or voucher.supplier)
+                )
+                self.items.append(item)
+                bucket.append(item)
     
     def _check_golf_generation(self) -> None:
         """Ensure golf data produces golf vouchers."""
-        golf_items = [i for i in self.items if i.type == 'golf']
+        golf_items = self._by_type['golf']
         
         if not golf_items and len(self.parsed_data.golf) == 0:
             # Check if there's golf data in ORGA that wasn't parsed
@@ -193,6 +257,9 @@ class VoucherValidator:
         
         for item in golf_items:
             if not item.voucher_generated:
+                if len(self.errors) >= _MAX_ERRORS:
+                    self._suppressed += 1
+                    continue
                 self.errors.append(
                     f"CRITICAL: Golf data detected but no voucher generated: {item.orga_name}"
                 )
@@ -200,36 +267,30 @@ class VoucherValidator:
     def _check_empty_titles(self) -> None:
         """Check for vouchers with empty or suspicious titles."""
         for item in self.items:
-            if item.voucher_generated:
+            if item.voucher_generated and item.suspicious_title:
+                if len(self.errors) >= _MAX_ERRORS:
+                    self._suppressed += 1
+                    continue
                 name = item.canonical_name or item.orga_name
-                if not name or len(name.strip()) < 3:
-                    self.errors.append(
-                        f"Empty/suspicious title for {item.type}: '{name}'"
-                    )
+                self.errors.append(
+                    f"Empty/suspicious title for {item.type}: '{name}'"
+                )
     
     def _build_report(self) -> ValidationReport:
         """Build the complete validation report."""
         suspicious = get_suspicious_names_log()
         
-        # Categorize items
-        hotels = [asdict(i) for i in self.items if i.type == 'hotel']
-        golf = [asdict(i) for i in self.items if i.type == 'golf']
-        activities = [asdict(i) for i in self.items if i.type == 'activity']
-        restaurants = [asdict(i) for i in self.items if i.type == 'restaurant']
-        transfers = [asdict(i) for i in self.items if i.type == 'transfer']
-        car_rentals = [asdict(i) for i in self.items if i.type == 'car_rental']
-        
-        generated = sum(1 for i in self.items if i.voucher_generated)
-        skipped = sum(1 for i in self.items if not i.voucher_generated)
+        # Items are already grouped by type
+        buckets = {
+            item_type: [item.to_dict() for item in self._by_type[item_type]]
+            for item_type in ('hotel', 'golf', 'activity', 'restaurant', 'transfer', 'car_rental')
+        }
+        generated = sum(1 for item in self.items if item.voucher_generated)
+        skipped = len(self.items) - generated
         
         # Check for critical errors
         passed = len(self.errors) == 0
         
-        # Log suspicious names as warnings but don't fail
-        if suspicious:
-            for name, category in suspicious:
-                logger.warning(f"Suspicious name without alias: '{name}' ({category})")
-        
         report = ValidationReport(
             timestamp=datetime.now().isoformat(),
             orga_file=self.orga_file,
@@ -237,12 +298,12 @@ class VoucherValidator:
             total_orga_items=len(self.items),
             vouchers_generated=generated,
             items_skipped=skipped,
-            hotels=hotels,
-            golf=golf,
-            activities=activities,
-            restaurants=restaurants,
-            transfers=transfers,
-            car_rentals=car_rentals,
+            hotels=buckets['hotel'],
+            golf=buckets['golf'],
+            activities=buckets['activity'],
+            restaurants=buckets['restaurant'],
+            transfers=buckets['transfer'],
+            car_rentals=buckets['car_rental'],
             suspicious_names=[{"name": n, "category": c} for n, c in suspicious],
             empty_titles=[],
             validation_errors=self.errors,
@@ -268,11 +329,14 @@ def validate_and_report(
         Tuple of (passed: bool, report_path: Optional[str])
     """
     validator = VoucherValidator(parsed_data, orga_file)
-    passed, report = validator.validate()
+    passed = validator.validate_fast()
     
     report_path = None
     
+    # The full report is only built when it is going to be written
     if not passed or output_dir:
+        report = validator._build_report()
+        
         # Write debug report
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
@@ -281,8 +345,17 @@ def validate_and_report(
             report_path = "run_debug_report.json"
         
         try:
-            with open(report_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(report), f, indent=2, default=str)
+            # All fields are already JSON types (dates are stringified per item)
+            if orjson is not None:
+                payload = orjson.dumps(report.to_dict(), option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(report.to_dict(), indent=2).encode('utf-8')
+            
+            # One write to a temp file, then an atomic rename - never a partial report
+            tmp_path = report_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, report_path)
             
             if not passed:
                 logger.error(f"Validation FAILED - see {report_path}")
@@ -297,38 +370,46 @@ def validate_and_report(
     return passed, report_path
 
 
-def get_validation_summary(parsed_data: ParsedORGA) -> Dict[str, Any]:
+class ValidationSummary(NamedTuple):
+    """Counts of detected items and vouchers that will be generated, by type."""
+    region: str
+    hotels_detected: int
+    hotels_will_generate: int
+    golf_detected: int
+    golf_will_generate: int
+    activities_detected: int
+    activities_will_generate: int
+    restaurants_detected: int
+    restaurants_will_generate: int
+    transfers_detected: int
+    transfers_will_generate: int
+    car_rentals_detected: int
+    car_rentals_will_generate: int
+
+
+def get_validation_summary(parsed_data: ParsedORGA) -> ValidationSummary:
     """Get a quick validation summary for logging.
     
-    Returns dict with counts of items by type and generation status.
+    Returns a flat ValidationSummary with counts of items by type and
+    generation status.
     """
     region = parsed_data.region
+    is_sa = region == "SA"
     
-    return {
-        "region": region,
-        "hotels": {
-            "detected": len(parsed_data.hotels),
-            "will_generate": len(parsed_data.hotels)
-        },
-        "golf": {
-            "detected": len(parsed_data.golf),
-            "will_generate": len(parsed_data.golf)
-        },
-        "activities": {
-            "detected": len(parsed_data.activities),
-            "will_generate": len(parsed_data.activities) if region == "SA" else 0
-        },
-        "restaurants": {
-            "detected": len(parsed_data.restaurants),
-            "will_generate": len(parsed_data.restaurants) if region == "SA" else 0
-        },
-        "transfers": {
-            "detected": len(parsed_data.transfers),
-            "will_generate": len(parsed_data.transfers)
-        },
-        "car_rentals": {
-            "detected": len(parsed_data.car_rentals),
-            "will_generate": len(parsed_data.car_rentals) if region == "SA" else 0
-        }
-    }
-
+    # Each list length is taken once and reused for both counts
+    hotels = len(parsed_data.hotels)
+    golf = len(parsed_data.golf)
+    activities = len(parsed_data.activities)
+    restaurants = len(parsed_data.restaurants)
+    transfers = len(parsed_data.transfers)
+    car_rentals = len(parsed_data.car_rentals)
+    
+    return ValidationSummary(
+        region,
+        hotels, hotels,
+        golf, golf,
+        activities, activities if is_sa else 0,
+        restaurants, restaurants if is_sa else 0,
+        transfers, transfers,
+        car_rentals, car_rentals if is_sa else 0,
+    )
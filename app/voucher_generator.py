@@ -5,16 +5,22 @@ the blank voucher template while preserving the original formatting.
 """
 import logging
 import os
+import re
 import copy
+import io
 import tempfile
 from datetime import date, timedelta
-from typing import List, Tuple, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Mapping, Tuple, Any, Optional
 from pathlib import Path
 
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
 
 from .models import (
     ParsedORGA, HotelStay, TransferVoucher, TransferLeg,
@@ -29,12 +35,29 @@ COLOR_GRAY = RGBColor(0x74, 0x74, 0x74)
 COLOR_RED = RGBColor(0xEE, 0x00, 0x00)
 COLOR_DARK = RGBColor(0x22, 0x22, 0x22)
 
+# Supplier header font sizes. These must be set on each run: the template's
+# header paragraphs only size their paragraph marks, so runs would otherwise
+# fall back to the 11pt document default.
+SIZE_SUPPLIER_NAME = Pt(14)
+SIZE_SUPPLIER_DETAIL = Pt(10)
 
+# Characters dropped from voucher filenames: anything but letters, digits,
+# space, '-' and '_' (\w follows str.isalnum(), so accented names are kept)
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w -]+')
+
+# Clark-notation names used by the XML helpers, resolved once
+_QN_P = qn('w:p')
+_QN_XML_SPACE = qn('xml:space')
+
+
+# A trip only has a handful of distinct dates - cache the strftime results
+@lru_cache(maxsize=512)
 def format_date(d: date) -> str:
     """Format date as 'DD Month YYYY'."""
     return d.strftime("%d %B %Y")
 
 
+@lru_cache(maxsize=512)
 def format_date_short(d: date) -> str:
     """Format date as 'DD.MM.YYYY'."""
     return d.strftime("%d.%m.%Y")
@@ -61,7 +84,6 @@ def expand_abbreviations(text: str) -> str:
     if not text:
         return text
     # Replace (CA) with (Clients Account) - case insensitive
-    import re
     text = re.sub(r'\(CA\)', '(Clients Account)', text, flags=re.IGNORECASE)
     return text
 
@@ -86,6 +108,93 @@ def add_text_with_style(paragraph, text: str, bold=False, italic=False, color=No
     return run
 
 
+# <w:rPr> element per (bold, italic, color, size), copied into each new run
+_RPR_CACHE: Dict[Tuple[bool, bool, Optional[RGBColor], Optional[Pt]], Any] = {}
+
+
+def _run_properties(bold: bool, italic: bool, color, size):
+    """Get the cached <w:rPr> for a style combination (None if unstyled).
+    
+    Built once through python-docx's own setters, so the XML is exactly
+    what setting the properties on each run would produce.
+    """
+    key = (bold, italic, color, size)
+    if key not in _RPR_CACHE:
+        run = Run(OxmlElement('w:r'), None)
+        if bold:
+            run.bold = True
+        if italic:
+            run.italic = True
+        if color is not None:
+            run.font.color.rgb = color
+        if size is not None:
+            run.font.size = size
+        _RPR_CACHE[key] = run._r.rPr
+    return _RPR_CACHE[key]
+
+
+def _prebuild_rpr_cache():
+    """Build the content section's run properties once, at import."""
+    for bold, italic, color in ((False, False, COLOR_GRAY), (True, False, COLOR_GRAY),
+                                (True, True, COLOR_GRAY), (True, True, COLOR_RED)):
+        _run_properties(bold, italic, color, None)
+
+
+_prebuild_rpr_cache()
+
+
+def _styled_run(paragraph, text: str, bold=False, italic=False, color=COLOR_GRAY, size=None):
+    """Add a run with the given styling in one step.
+    
+    Only properties that are set get written (False leaves bold/italic
+    unset, as in the template); the run properties are a copy of a cached
+    element instead of one python-docx setter call per property.
+    """
+    rpr = _run_properties(bold, italic, color, size)
+    
+    if '\t' in text or '\n' in text or '\r' in text:
+        # Tabs and line breaks need python-docx's <w:tab/>/<w:br/> conversion
+        run = paragraph.add_run(text)
+        if rpr is not None:
+            run._r.insert(0, copy.deepcopy(rpr))
+        return run
+    
+    # Plain text: build <w:r><w:rPr/><w:t/></w:r> directly, as add_run() would
+    r = OxmlElement('w:r')
+    if rpr is not None:
+        r.append(copy.deepcopy(rpr))
+    if text:
+        t = OxmlElement('w:t')
+        t.text = text
+        if len(text.strip()) < len(text):
+            t.set(_QN_XML_SPACE, 'preserve')
+        r.append(t)
+    paragraph._p.append(r)
+    return Run(r, paragraph)
+
+
+def save_document(doc, output_path: str):
+    """Save a document with a single write of the finished .docx.
+    
+    doc.save() to a path streams the zip in many small writes; building it
+    in memory first hands the whole file to the OS at once.
+    """
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    Path(output_path).write_bytes(buffer.getbuffer())
+
+
+def clear_cell_paragraphs(cell):
+    """Empty every paragraph of a table cell, keeping paragraph properties.
+    
+    Same result as calling Paragraph.clear() on each paragraph, but each
+    paragraph's children are replaced in a single lxml operation.
+    """
+    for p in cell._tc.findall(_QN_P):
+        ppr = p.pPr
+        p[:] = [ppr] if ppr is not None else []
+
+
 def clear_paragraph_after_label(paragraph, label: str):
     """Clear text after a label while preserving the label formatting."""
     # Keep the label, remove everything after
@@ -151,13 +260,47 @@ def remove_blank_pages(doc):
     return doc
 
 
+def _earliest_leg_date(transfer: TransferVoucher) -> date:
+    """Date of the transfer's earliest leg (today if it has none)."""
+    return min(leg.date for leg in transfer.legs) if transfer.legs else date.today()
+
+
+def _earliest_entry_date(activity: ActivityVoucher) -> date:
+    """Date of the activity's earliest entry (today if it has none)."""
+    return min(e.date for e in activity.entries) if activity.entries else date.today()
+
+
 class VoucherGenerator:
     """Generates voucher documents from parsed ORGA data."""
     
+    # (voucher kind, ParsedORGA attribute, voucher date getter,
+    #  skip log message outside SA - None if generated for both regions)
+    # Order is the generation order. Car rentals are SA only per /Vouchers
+    # source of truth; EU trips do NOT get activity vouchers per "FIT EU
+    # VOUCHER TEMPLATE" ("No Activity Voucher Needed") nor restaurant
+    # (prepaid meal) vouchers per template overview.
+    _SPECS = (
+        ("hotel", "hotels", lambda h: h.check_in, None),
+        ("transfer", "transfers", _earliest_leg_date, None),
+        ("car_rental", "car_rentals", lambda c: c.pickup_date,
+         "car rental vouchers (EU region - not required)"),
+        ("activity", "activities", _earliest_entry_date,
+         "activity vouchers (EU region - not required per template)"),
+        ("restaurant", "restaurants", lambda r: r.date,
+         "restaurant vouchers (EU region - not required)"),
+        ("golf", "golf", lambda g: g.date, None),
+    )
+    
     def __init__(self, template_path: str):
         """Initialize with path to blank voucher template."""
         self.template_path = template_path
         self.generated_vouchers: List[Tuple[str, str, date]] = []
+        # Raw template file, read on first use and shared by all vouchers
+        self._template_bytes: Optional[bytes] = None
+        # Parsed template that each voucher deep-copies (never modified itself)
+        self._golden_doc: Optional[Document] = None
+        # Supplier lookups for this generator - trips repeat the same suppliers
+        self._supplier_info: Dict[str, Mapping[str, str]] = {}
     
     def generate_all(
         self,
@@ -176,83 +319,70 @@ class VoucherGenerator:
         Based on /Vouchers source of truth folder.
         """
         if output_dir is None:
+            # mkdtemp already creates the directory
             output_dir = tempfile.mkdtemp(prefix="vouchers_")
-        
-        os.makedirs(output_dir, exist_ok=True)
+        else:
+            os.makedirs(output_dir, exist_ok=True)
         self.generated_vouchers = []
         
         region = parsed_data.region  # 'SA' or 'EU'
         logger.info(f"Generating vouchers for region: {region}")
         
-        # Generate hotel vouchers (BOTH SA and EU)
-        for i, hotel in enumerate(parsed_data.hotels):
-            path = os.path.join(output_dir, f"hotel_{i+1}_{self._safe_filename(hotel.supplier)}.docx")
-            self._generate_hotel_voucher(hotel, traveller_names, ref_no, path)
-            self.generated_vouchers.append((path, "hotel", hotel.check_in))
-            logger.info(f"Generated hotel voucher: {hotel.supplier}")
-        
-        # Generate transfer vouchers (BOTH SA and EU)
-        for i, transfer in enumerate(parsed_data.transfers):
-            path = os.path.join(output_dir, f"transfer_{i+1}_{self._safe_filename(transfer.supplier)}.docx")
-            self._generate_transfer_voucher(transfer, traveller_names, ref_no, path)
-            earliest = min(leg.date for leg in transfer.legs) if transfer.legs else date.today()
-            self.generated_vouchers.append((path, "transfer", earliest))
-            logger.info(f"Generated transfer voucher: {transfer.supplier}")
-        
-        # Generate car rental vouchers (SA only - per /Vouchers source of truth)
-        if region == "SA":
-            for i, car in enumerate(parsed_data.car_rentals):
-                path = os.path.join(output_dir, f"car_rental_{i+1}_{self._safe_filename(car.supplier)}.docx")
-                self._generate_car_rental_voucher(car, traveller_names, ref_no, group_text, path)
-                self.generated_vouchers.append((path, "car_rental", car.pickup_date))
-                logger.info(f"Generated car rental voucher: {car.supplier}")
-        elif parsed_data.car_rentals:
-            logger.info(f"Skipping {len(parsed_data.car_rentals)} car rental vouchers (EU region - not required)")
-        
-        # Generate activity vouchers (SA only - per /Vouchers template overview)
-        # EU trips do NOT get activity vouchers per "FIT EU VOUCHER TEMPLATE" which says "No Activity Voucher Needed"
-        if region == "SA":
-            for i, activity in enumerate(parsed_data.activities):
-                path = os.path.join(output_dir, f"activity_{i+1}_{self._safe_filename(activity.supplier)}.docx")
-                self._generate_activity_voucher(activity, traveller_names, ref_no, path)
-                earliest = min(e.date for e in activity.entries) if activity.entries else date.today()
-                self.generated_vouchers.append((path, "activity", earliest))
-                logger.info(f"Generated activity voucher: {activity.supplier}")
-        elif parsed_data.activities:
-            logger.info(f"Skipping {len(parsed_data.activities)} activity vouchers (EU region - not required per template)")
-        
-        # Generate restaurant vouchers (SA only - prepaid meals)
-        # EU trips do NOT get restaurant vouchers per template overview
-        if region == "SA":
-            for i, restaurant in enumerate(parsed_data.restaurants):
-                path = os.path.join(output_dir, f"restaurant_{i+1}_{self._safe_filename(restaurant.supplier)}.docx")
-                self._generate_restaurant_voucher(restaurant, traveller_names, ref_no, path)
-                self.generated_vouchers.append((path, "restaurant", restaurant.date))
-                logger.info(f"Generated restaurant voucher: {restaurant.supplier}")
-        elif parsed_data.restaurants:
-            logger.info(f"Skipping {len(parsed_data.restaurants)} restaurant vouchers (EU region - not required)")
-        
-        # Generate golf vouchers (BOTH SA and EU)
-        for i, golf in enumerate(parsed_data.golf):
-            path = os.path.join(output_dir, f"golf_{i+1}_{self._safe_filename(golf.supplier)}.docx")
-            self._generate_golf_voucher(golf, traveller_names, ref_no, path)
-            self.generated_vouchers.append((path, "golf", golf.date))
-            logger.info(f"Generated golf voucher: {golf.supplier}")
+        for kind, attr, get_date, skip_message in self._SPECS:
+            vouchers = getattr(parsed_data, attr)
+            if skip_message is not None and region != "SA":
+                if vouchers:
+                    logger.info(f"Skipping {len(vouchers)} {skip_message}")
+                continue
+            for i, voucher in enumerate(vouchers):
+                path = os.path.join(output_dir, f"{kind}_{i+1}_{self._safe_filename(voucher.supplier)}.docx")
+                self._generate_voucher(kind, voucher, traveller_names, ref_no, group_text, path)
+                self.generated_vouchers.append((path, kind, get_date(voucher)))
+                logger.info(f"Generated {kind.replace('_', ' ')} voucher: {voucher.supplier}")
         
         return self.generated_vouchers
     
+    def _generate_voucher(self, kind: str, voucher: Any, traveller_names: str,
+                          ref_no: str, group_text: str, output_path: str):
+        """Generate one voucher of the given kind."""
+        if kind == "car_rental":
+            self._generate_car_rental_voucher(voucher, traveller_names, ref_no, group_text, output_path)
+        elif kind == "hotel":
+            self._generate_hotel_voucher(voucher, traveller_names, ref_no, output_path)
+        elif kind == "transfer":
+            self._generate_transfer_voucher(voucher, traveller_names, ref_no, output_path)
+        elif kind == "activity":
+            self._generate_activity_voucher(voucher, traveller_names, ref_no, output_path)
+        elif kind == "restaurant":
+            self._generate_restaurant_voucher(voucher, traveller_names, ref_no, output_path)
+        elif kind == "golf":
+            self._generate_golf_voucher(voucher, traveller_names, ref_no, output_path)
+        else:
+            raise ValueError(f"Unknown voucher kind: {kind}")
+    
     def _safe_filename(self, name: str) -> str:
         """Create a safe filename from supplier name."""
-        safe = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_'))
+        safe = _UNSAFE_FILENAME_RE.sub('', name)
         return safe.strip().replace(' ', '_')[:50]
     
     def _load_template(self) -> Document:
-        """Load a fresh copy of the template document."""
-        return Document(self.template_path)
+        """Load a fresh copy of the template document.
+        
+        The template is read and parsed once; every voucher gets a deep
+        copy of the parsed document, which skips the unzip and XML parse.
+        """
+        if self._golden_doc is None:
+            if self._template_bytes is None:
+                self._template_bytes = Path(self.template_path).read_bytes()
+            self._golden_doc = Document(io.BytesIO(self._template_bytes))
+        return copy.deepcopy(self._golden_doc)
     
-    def _get_supplier_info(self, supplier_name: str) -> dict:
-        """Get supplier info from database."""
-        return get_supplier_info(supplier_name)
+    def _get_supplier_info(self, supplier_name: str) -> Mapping[str, str]:
+        """Get supplier info from database, memoized per generator."""
+        info = self._supplier_info.get(supplier_name)
+        if info is None:
+            info = self._supplier_info[supplier_name] = get_supplier_info(supplier_name)
+        return info
     
     def _fill_supplier_header(self, doc: Document, supplier_name: str, category: str = None):
         """Fill the supplier header section (Row 1 of the table).
@@ -282,36 +412,27 @@ class VoucherGenerator:
             info = self._get_supplier_info(supplier_name)
         
         # Clear existing content
-        for para in cell.paragraphs:
-            para.clear()
+        clear_cell_paragraphs(cell)
         
         # Add supplier name (bold, larger)
         p = cell.paragraphs[0] if cell.paragraphs else cell.add_paragraph()
-        run = p.add_run(info.get("display_name", supplier_name.upper()))
-        run.bold = True
-        run.font.size = Pt(14)
-        run.font.color.rgb = COLOR_DARK
+        _styled_run(p, info.get("display_name", supplier_name.upper()),
+                    bold=True, color=COLOR_DARK, size=SIZE_SUPPLIER_NAME)
         
         # Add address
         if info.get("address"):
             p = cell.add_paragraph()
-            run = p.add_run(info["address"])
-            run.font.size = Pt(10)
-            run.font.color.rgb = COLOR_GRAY
+            _styled_run(p, info["address"], size=SIZE_SUPPLIER_DETAIL)
         
         # Add phone
         if info.get("phone"):
             p = cell.add_paragraph()
-            run = p.add_run(f"Tel: {info['phone']}")
-            run.font.size = Pt(10)
-            run.font.color.rgb = COLOR_GRAY
+            _styled_run(p, f"Tel: {info['phone']}", size=SIZE_SUPPLIER_DETAIL)
         
         # Add GPS
         if info.get("gps"):
             p = cell.add_paragraph()
-            run = p.add_run(f"GPS: {info['gps']}")
-            run.font.size = Pt(10)
-            run.font.color.rgb = COLOR_GRAY
+            _styled_run(p, f"GPS: {info['gps']}", size=SIZE_SUPPLIER_DETAIL)
     
     def _fill_content_section(
         self,
@@ -338,18 +459,21 @@ class VoucherGenerator:
         cell = table.rows[2].cells[0]
         
         # Clear existing paragraphs
-        for para in cell.paragraphs:
-            para.clear()
+        clear_cell_paragraphs(cell)
         
         paragraphs = cell.paragraphs
         current_idx = 0
+        # Paragraphs beyond the template's own, added to the cell in one go at the end
+        new_paras = []
         
         def get_or_add_para():
             nonlocal current_idx
             if current_idx < len(paragraphs):
                 p = paragraphs[current_idx]
             else:
-                p = cell.add_paragraph()
+                p_element = OxmlElement('w:p')
+                new_paras.append(p_element)
+                p = Paragraph(p_element, cell)
             current_idx += 1
             return p
         
@@ -358,22 +482,16 @@ class VoucherGenerator:
         
         # TRAVELLERS line
         p = get_or_add_para()
-        run = p.add_run("TRAVELLERS: ")
-        run.bold = True
-        run.font.color.rgb = COLOR_GRAY
-        run = p.add_run(traveller_names)
-        run.font.color.rgb = COLOR_GRAY
+        _styled_run(p, "TRAVELLERS: ", bold=True)
+        _styled_run(p, traveller_names)
         
         # Empty line
         get_or_add_para()
         
         # REF NO line
         p = get_or_add_para()
-        run = p.add_run("REF NO: ")
-        run.bold = True
-        run.font.color.rgb = COLOR_GRAY
-        run = p.add_run(ref_no if ref_no else "")
-        run.font.color.rgb = COLOR_GRAY
+        _styled_run(p, "REF NO: ", bold=True)
+        _styled_run(p, ref_no if ref_no else "")
         
         # Empty line
         get_or_add_para()
@@ -381,74 +499,47 @@ class VoucherGenerator:
         # GROUP line (if provided)
         if group_text:
             p = get_or_add_para()
-            run = p.add_run("GROUP: ")
-            run.bold = True
-            run.font.color.rgb = COLOR_GRAY
-            run = p.add_run(group_text)
-            run.font.color.rgb = COLOR_GRAY
+            _styled_run(p, "GROUP: ", bold=True)
+            _styled_run(p, group_text)
             get_or_add_para()
         
         # CHECK IN / CHECK OUT lines (for hotels)
         if check_in and check_out:
             p = get_or_add_para()
-            run = p.add_run("CHECK IN: ")
-            run.bold = True
-            run.font.color.rgb = COLOR_GRAY
-            run = p.add_run(f"{check_in}")
-            run.font.color.rgb = COLOR_GRAY
-            run = p.add_run("                TIME: ")
-            run.bold = True
-            run.font.color.rgb = COLOR_GRAY
-            run = p.add_run("14h00")
-            run.font.color.rgb = COLOR_GRAY
+            _styled_run(p, "CHECK IN: ", bold=True)
+            _styled_run(p, f"{check_in}")
+            _styled_run(p, "                TIME: ", bold=True)
+            _styled_run(p, "14h00")
             
             p = get_or_add_para()
-            run = p.add_run("CHECK OUT: ")
-            run.bold = True
-            run.font.color.rgb = COLOR_GRAY
-            run = p.add_run(f"{check_out}")
-            run.font.color.rgb = COLOR_GRAY
-            run = p.add_run("              TIME: ")
-            run.bold = True
-            run.font.color.rgb = COLOR_GRAY
-            run = p.add_run("11h00")
-            run.font.color.rgb = COLOR_GRAY
-            run = p.add_run("              NIGHTS: ")
-            run.bold = True
-            run.font.color.rgb = COLOR_GRAY
-            run = p.add_run(str(nights))
-            run.font.color.rgb = COLOR_GRAY
+            _styled_run(p, "CHECK OUT: ", bold=True)
+            _styled_run(p, f"{check_out}")
+            _styled_run(p, "              TIME: ", bold=True)
+            _styled_run(p, "11h00")
+            _styled_run(p, "              NIGHTS: ", bold=True)
+            _styled_run(p, str(nights))
             
             get_or_add_para()
         
         # DATE line (for activities/restaurants)
         elif date_single:
             p = get_or_add_para()
-            run = p.add_run("DATE: ")
-            run.bold = True
-            run.font.color.rgb = COLOR_GRAY
-            run = p.add_run(date_single)
-            run.font.color.rgb = COLOR_GRAY
+            _styled_run(p, "DATE: ", bold=True)
+            _styled_run(p, date_single)
             
             get_or_add_para()
         
         # TIME line (for activities/restaurants)
         if time_text:
             p = get_or_add_para()
-            run = p.add_run("TIME: ")
-            run.bold = True
-            run.font.color.rgb = COLOR_GRAY
-            run = p.add_run(time_text)
-            run.font.color.rgb = COLOR_GRAY
+            _styled_run(p, "TIME: ", bold=True)
+            _styled_run(p, time_text)
             
             get_or_add_para()
         
         # Included Services section
         p = get_or_add_para()
-        run = p.add_run("Included Services:")
-        run.bold = True
-        run.italic = True
-        run.font.color.rgb = COLOR_GRAY
+        _styled_run(p, "Included Services:", bold=True, italic=True)
         
         get_or_add_para()
         
@@ -461,22 +552,16 @@ class VoucherGenerator:
                     
                     p = get_or_add_para()
                     # Add bullet point
-                    run = p.add_run("•    ")
-                    run.font.color.rgb = COLOR_GRAY
+                    _styled_run(p, "•    ")
                     
                     # Check if service has a label (e.g., "Accommodation Type:")
                     if ":" in service:
                         parts = service.split(":", 1)
-                        run = p.add_run(f"{parts[0]}:")
-                        run.bold = True
-                        run.italic = True
-                        run.font.color.rgb = COLOR_GRAY
+                        _styled_run(p, f"{parts[0]}:", bold=True, italic=True)
                         if len(parts) > 1:
-                            run = p.add_run(f" {parts[1].strip()}")
-                            run.font.color.rgb = COLOR_GRAY
+                            _styled_run(p, f" {parts[1].strip()}")
                     else:
-                        run = p.add_run(service)
-                        run.font.color.rgb = COLOR_GRAY
+                        _styled_run(p, service)
         
         # Notes section
         if notes:
@@ -485,26 +570,24 @@ class VoucherGenerator:
             
             get_or_add_para()
             p = get_or_add_para()
-            run = p.add_run("Notes:")
-            run.bold = True
-            run.font.color.rgb = COLOR_GRAY
+            _styled_run(p, "Notes:", bold=True)
             
             p = get_or_add_para()
-            run = p.add_run(notes)
-            run.font.color.rgb = COLOR_GRAY
+            _styled_run(p, notes)
         
         # Empty line before disclaimer
         get_or_add_para()
         
         # Red disclaimer line
         p = get_or_add_para()
-        run = p.add_run("All additional services are for guest's own account")
-        run.bold = True
-        run.italic = True
-        run.font.color.rgb = COLOR_RED
+        _styled_run(p, "All additional services are for guest's own account", bold=True, italic=True, color=COLOR_RED)
         
         # Final empty line
         get_or_add_para()
+        
+        # Same position as cell.add_paragraph() - appended after the existing ones
+        if new_paras:
+            cell._tc.extend(new_paras)
     
     def _generate_hotel_voucher(
         self,
@@ -531,15 +614,17 @@ class VoucherGenerator:
         if hotel.board and hotel.board.upper() in ["FB+", "FB"]:
             services.append("")
             services.append("Activities:")
-            current = hotel.check_in
-            while current < hotel.check_out:
-                if current == hotel.check_in:
-                    services.append(f"    {format_date_short(current)} – X1 Afternoon Game Drive")
-                elif current == hotel.check_out - timedelta(days=1):
-                    services.append(f"    {format_date_short(current)} – X1 Morning Game Drive")
+            first_night = hotel.check_in
+            last_night = hotel.check_out - timedelta(days=1)
+            for offset in range((hotel.check_out - first_night).days):
+                current = first_night + timedelta(days=offset)
+                if current == first_night:
+                    drives = "X1 Afternoon Game Drive"
+                elif current == last_night:
+                    drives = "X1 Morning Game Drive"
                 else:
-                    services.append(f"    {format_date_short(current)} – X1 Morning & Afternoon Game Drive")
-                current += timedelta(days=1)
+                    drives = "X1 Morning & Afternoon Game Drive"
+                services.append(f"    {format_date_short(current)} – {drives}")
         
         # Fill content
         self._fill_content_section(
@@ -554,7 +639,7 @@ class VoucherGenerator:
         )
         
         remove_blank_pages(doc)
-        doc.save(output_path)
+        save_document(doc, output_path)
     
     def _generate_transfer_voucher(
         self,
@@ -571,17 +656,18 @@ class VoucherGenerator:
         # Build services list
         services = []
         for leg in transfer.legs:
-            pickup_text = f"Pick Up: {format_date_short(leg.date)}"
+            # Collect the pick-up line's parts and join once
+            parts = [f"Pick Up: {format_date_short(leg.date)}"]
             if leg.pickup_location:
-                pickup_text += f" – {leg.pickup_location}"
+                parts.append(f" – {leg.pickup_location}")
             if leg.pickup_time:
-                pickup_text += f" @ {leg.pickup_time}"
+                parts.append(f" @ {leg.pickup_time}")
             if leg.flight_number:
-                pickup_text += f" (Flight {leg.flight_number})"
+                parts.append(f" (Flight {leg.flight_number})")
             if "airport" in (leg.pickup_location or "").lower():
-                pickup_text += " – Your driver will meet you in the arrivals hall with your name board."
+                parts.append(" – Your driver will meet you in the arrivals hall with your name board.")
             
-            services.append(pickup_text)
+            services.append("".join(parts))
             
             if leg.dropoff_location:
                 services.append(f"Drop Off: {leg.dropoff_location}")
@@ -603,7 +689,7 @@ class VoucherGenerator:
         )
         
         remove_blank_pages(doc)
-        doc.save(output_path)
+        save_document(doc, output_path)
     
     def _generate_car_rental_voucher(
         self,
@@ -643,7 +729,7 @@ class VoucherGenerator:
         )
         
         remove_blank_pages(doc)
-        doc.save(output_path)
+        save_document(doc, output_path)
     
     def _generate_activity_voucher(
         self,
@@ -666,11 +752,10 @@ class VoucherGenerator:
         else:
             services = []
             for entry in activity.entries:
-                line = f"{format_date_short(entry.date)}"
                 if entry.time:
-                    line += f" – {entry.time}"
-                line += f" – {entry.activity_name}"
-                services.append(line)
+                    services.append(f"{format_date_short(entry.date)} – {entry.time} – {entry.activity_name}")
+                else:
+                    services.append(f"{format_date_short(entry.date)} – {entry.activity_name}")
             date_single = ""
             time_text = ""
             notes = "\n".join(e.notes for e in activity.entries if e.notes)
@@ -686,7 +771,7 @@ class VoucherGenerator:
         )
         
         remove_blank_pages(doc)
-        doc.save(output_path)
+        save_document(doc, output_path)
     
     def _generate_restaurant_voucher(
         self,
@@ -712,7 +797,7 @@ class VoucherGenerator:
         )
         
         remove_blank_pages(doc)
-        doc.save(output_path)
+        save_document(doc, output_path)
     
     def _generate_golf_voucher(
         self,
@@ -728,10 +813,10 @@ class VoucherGenerator:
         self._fill_supplier_header(doc, golf.supplier, category="golf")
         
         # Get the golf course display name
-        golf_info = get_supplier_info(golf.supplier + " GC")
+        golf_info = self._get_supplier_info(golf.supplier + " GC")
         if not golf_info.get("address"):
             # Fallback: try without GC suffix but still look in config
-            golf_info = get_supplier_info(golf.supplier)
+            golf_info = self._get_supplier_info(golf.supplier)
         
         # Use the golf course name from config if available, otherwise use course from ORGA
         course_display = golf_info.get("display_name", golf.course)
@@ -753,4 +838,4 @@ class VoucherGenerator:
         )
         
         remove_blank_pages(doc)
-        doc.save(output_path)
+        save_document(doc, output_path)
@@ -0,0 +1,59 @@
+"""Tests for ORGA sheet loading."""
+import os
+import re
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+from openpyxl import Workbook
+
+from app.orga_parser import _load_rows
+
+
+def _write_stale_dimension_workbook(path: str) -> None:
+    """Write a workbook whose "Orga" sheet declares <dimension ref="A1:A1">.
+    
+    The first sheet ("Orga template") has no data; "Orga" has a hotel
+    supplier in column 5 of row 12, outside the declared dimension.
+    """
+    wb = Workbook()
+    wb.active.title = "Orga template"
+    ws = wb.create_sheet("Orga")
+    for row in range(1, 13):
+        for col in range(1, 8):
+            ws.cell(row, col, f"v{row}{col}")
+    ws.cell(12, 5, "Cape Grace")
+    tmp_path = path + ".tmp"
+    wb.save(tmp_path)
+    
+    # Rewrite the sheet's declared dimension to a stale A1:A1
+    with zipfile.ZipFile(tmp_path) as src, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "xl/worksheets/sheet2.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1:A1"', data)
+            dst.writestr(item, data)
+    os.remove(tmp_path)
+
+
+class LoadRowsStaleDimensionTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "ORGA 1 SA Test.xlsx")
+        _write_stale_dimension_workbook(self.path)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+    
+    def test_orga_sheet_with_stale_dimension_is_selected(self):
+        rows = list(_load_rows(self.path))
+        
+        self.assertEqual(len(rows), 12)
+        self.assertEqual(rows[0][:7], tuple(f"v1{col}" for col in range(1, 8)))
+        self.assertEqual(rows[11][4], "Cape Grace")
+
+
+if __name__ == "__main__":
+    unittest.main()